@@ -1,22 +1,53 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, send_file
+from flask_compress import Compress
+from werkzeug.middleware.proxy_fix import ProxyFix
 import os
 import sys
+import time
+import json
+import uuid
+import hashlib
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
-# Ensure backend directory is in python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from job_engine import scout_for_jobs, deep_read_jobs, analyze_jobs_with_groq
-from job_memory import filter_new_jobs, mark_jobs_seen, get_seen_count, clear_memory
 import io
-import PyPDF2
 from dotenv import load_dotenv
 
-# Load .env from parent directory (where the actual .env file is)
+# Load .env from parent directory (where the actual .env file is).
+# Must run before the backend imports — their settings are read at import time.
 env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
 load_dotenv(env_path)
 
+# Ensure backend directory is in python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_engine import scout_for_jobs, deep_read_jobs, analyze_jobs_with_groq, analyze_job_batch_with_groq, make_deadline, merge_analyses, drop_match_sections, HUNT_DEADLINE_SECONDS
+from job_engine import select_deep_read_targets, DEEP_READ_BUDGET, DEEP_READ_MAX_BUDGET
+from job_engine import forecast_groq_quota, SERVICE_MODES
+from job_admission import get_client_id, admit_hunt, release_hunt
+from job_engine import warm_up as warm_up_engine
+from job_prompts import PROMPT_VARIANTS, report_prompt_token_counts
+from job_dates import filter_fresh_jobs, TIME_FILTER_DAYS, FRESHNESS_GRACE
+from job_ranker import rank_jobs_locally, query_keywords
+from job_memory import filter_new_jobs, mark_jobs_seen, get_seen_count, clear_memory, save_hunt_jobs, get_hunt_jobs, get_domain_health
+from job_memory import save_hunt_snapshot, get_hunt_snapshot, save_jobs_to_corpus, update_corpus_reads, search_corpus
+from job_profiler import should_profile, start_profile, finish_profile, list_profiles, get_profile_path, PROFILING_ENABLED
+
 app = Flask(__name__)
 
+# gzip/brotli for JSON responses (hunt reports and job lists compress ~5-10x)
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
+
+# Reverse proxies in front of the app that append to X-Forwarded-For (Render: 1).
+# request.remote_addr is then the real client IP; with 0 the header is ignored,
+# since anything the client sends in it is spoofable.
+TRUSTED_PROXY_HOPS = int(os.environ.get("TRUSTED_PROXY_HOPS", "1" if os.environ.get("RENDER") else "0"))
+if TRUSTED_PROXY_HOPS:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS)
+
 # Groq API keys for Llama 3.3 analysis (3-key failover system)
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GROQ_API_KEY_BACKUP = os.getenv("GROQ_API_KEY_BACKUP")
@@ -122,11 +153,233 @@ TIME_FILTERS = [
     {"value": "past_month", "label": "📆 Past Month"},
 ]
 
+# Static dropdown data never changes at runtime — hash it once for /api/options ETags
+OPTIONS_STATIC_VERSION = hashlib.sha1(
+    json.dumps([JOB_ROLES, LOCATIONS, JOB_TYPES, TIME_FILTERS], sort_keys=True).encode()
+).hexdigest()[:16]
+
+# Shown instead of a Groq report when the local date check rejected everything
+ALL_STALE_MESSAGE = "❌ No fresh jobs found. Every result was older than your time filter. Try 'Past Month' filter or different search terms."
+
+# Max (job_title, location, job_type, time_filter) combos per /api/hunt/batch request
+MAX_BATCH_HUNTS = 8
+
+# raw_jobs field selection + pagination
+RAW_JOB_FIELDS = ["title", "href", "body", "is_new", "posted_at"]
+RAW_JOB_DEFAULT_FIELDS = ["title", "href", "is_new", "posted_at"]  # body is fetched lazily
+RAW_JOBS_DEFAULT_PAGE_SIZE = 20
+RAW_JOBS_MAX_PAGE_SIZE = 50
+
+# Delta hunts: a snapshot whose base analysis is older than this is re-analyzed from scratch (dates drift)
+DELTA_SNAPSHOT_MAX_AGE = timedelta(hours=6)
+DELTA_SNAPSHOT_MAX_JOBS = 100  # Oldest merged jobs (and their report sections) are dropped past this
+
+# Local corpus: extra matches merged into a live hunt / returned by /api/hunt/instant
+CORPUS_MATCH_LIMIT = 10
+INSTANT_MATCH_LIMIT = 20
+
+
+def parse_raw_job_params(params):
+    """
+    Read `fields`, `page`, `page_size` from a JSON body or query string.
+    `fields` may be a list or a comma-separated string; "*" selects everything.
+    Returns (fields, page, page_size) or raises ValueError with a client-facing message.
+    """
+    fields = params.get('fields') or RAW_JOB_DEFAULT_FIELDS
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(',') if f.strip()]
+    if fields == ["*"]:
+        fields = RAW_JOB_FIELDS
+    unknown = [f for f in fields if f not in RAW_JOB_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown raw_jobs field(s): {', '.join(unknown)}. Allowed: {', '.join(RAW_JOB_FIELDS)}")
+
+    try:
+        page = int(params.get('page', 1))
+        page_size = int(params.get('page_size', RAW_JOBS_DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        raise ValueError("page and page_size must be integers")
+    if page < 1 or not 1 <= page_size <= RAW_JOBS_MAX_PAGE_SIZE:
+        raise ValueError(f"page must be >= 1 and page_size between 1 and {RAW_JOBS_MAX_PAGE_SIZE}")
+    return fields, page, page_size
+
+
+def parse_deadline_seconds(data):
+    """Latency budget: request may tighten/loosen the configured per-hunt deadline."""
+    try:
+        deadline_seconds = float(data.get('deadline_seconds', HUNT_DEADLINE_SECONDS))
+    except (TypeError, ValueError):
+        raise ValueError("deadline_seconds must be a number")
+    if not 1 <= deadline_seconds <= 120:
+        raise ValueError("deadline_seconds must be between 1 and 120")
+    return deadline_seconds
+
+
+def parse_deep_read_budget(data):
+    """Optional "deep_read_budget": pages to deep-read per hunt (0 = snippets only)."""
+    try:
+        budget = int(data.get('deep_read_budget', DEEP_READ_BUDGET))
+    except (TypeError, ValueError):
+        raise ValueError("deep_read_budget must be an integer")
+    if not 0 <= budget <= DEEP_READ_MAX_BUDGET:
+        raise ValueError(f"deep_read_budget must be between 0 and {DEEP_READ_MAX_BUDGET}")
+    return budget
+
+
+def parse_prompt_variant(data):
+    """Optional "prompt_variant": "full" | "compact" (None = server default)."""
+    variant = data.get('prompt_variant')
+    if variant is not None and variant not in PROMPT_VARIANTS:
+        raise ValueError(f"prompt_variant must be one of: {', '.join(PROMPT_VARIANTS)}")
+    return variant
+
+
+def parse_since(data):
+    """Optional "since": the `cursor` returned by a previous hunt (ISO timestamp)."""
+    since = data.get('since')
+    if since is None:
+        return None
+    try:
+        datetime.fromisoformat(since)
+    except (TypeError, ValueError):
+        raise ValueError("since must be the cursor (ISO timestamp) returned by a previous hunt")
+    return since
+
+
+def make_hunt_key(job_title, location, time_filter, job_type, resume_text):
+    """Delta snapshots are shared by hunts with the same role, location, filters and resume."""
+    resume_hash = hashlib.sha1((resume_text or "").strip().encode("utf-8")).hexdigest()
+    parts = [job_title.strip().lower(), location.strip().lower(), time_filter, job_type, resume_hash]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def corpus_since(time_filter):
+    """Oldest posting date (UTC ISO) a corpus match may have for this time_filter."""
+    window = timedelta(days=TIME_FILTER_DAYS.get(time_filter, 7)) + FRESHNESS_GRACE
+    return (datetime.now(timezone.utc) - window).isoformat()
+
+
+def apply_service_mode(deep_read_budget, prompt_variant):
+    """
+    Quota-aware load shedding: as the Groq budget's runway shrinks, hunts get
+    fewer deep reads and the compact prompt. Returns (deep_read_budget, prompt_variant, mode).
+    """
+    quota = forecast_groq_quota()
+    mode = SERVICE_MODES[quota['mode']]
+    if mode['deep_read_budget'] is not None:
+        deep_read_budget = min(deep_read_budget, mode['deep_read_budget'])
+    if mode['prompt_variant']:
+        prompt_variant = mode['prompt_variant']
+    if quota['mode'] != "normal":
+        runway = f"{quota['runway_hours']}h" if quota['runway_hours'] is not None else "n/a"
+        print(f"📉 Service mode {quota['mode']}: {quota['tokens_remaining']:,} tokens left, "
+              f"burn {quota['burn_per_hour']:,}/h (runway {runway}) → deep reads ≤{deep_read_budget}, {prompt_variant} prompt")
+    return deep_read_budget, prompt_variant, quota['mode']
+
+
+def admission_controlled(slot_weight=None):
+    """
+    Hold admission slots for the whole hunt; reject fast with 429/503 when over the limits.
+    slot_weight() gives how many slots the request needs (default 1).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method == 'OPTIONS':
+                return view(*args, **kwargs)
+            # The deadline runs from arrival — time spent queued counts against the SLO
+            g.hunt_started = time.monotonic()
+            weight = slot_weight() if slot_weight else 1
+            slot_id, rejection = admit_hunt(get_client_id(request.remote_addr), weight)
+            if rejection:
+                response = jsonify({"error": rejection['error']})
+                response.status_code = rejection['status']
+                response.headers['Retry-After'] = str(rejection['retry_after'])
+                return response
+            try:
+                return view(*args, **kwargs)
+            finally:
+                release_hunt(slot_id)
+        return wrapper
+    return decorator
+
+
+def batch_slot_weight():
+    """A batch runs one scout / deep-read / analysis pipeline per combo, so it holds one slot per combo."""
+    combos = (request.get_json(silent=True) or {}).get('hunts')
+    return len(combos) if isinstance(combos, list) else 1
+
+
+def get_groq_api_keys():
+    """All 3 keys for analyze_jobs_with_groq's automatic failover."""
+    return {
+        "primary": GROQ_API_KEY,
+        "backup": GROQ_API_KEY_BACKUP,
+        "tertiary": GROQ_API_KEY_TERTIARY
+    }
+
+
+def prune_stale_snapshot(snapshot, time_filter):
+    """Drop snapshot jobs that have aged out of time_filter, and their sections in the stored report."""
+    fresh_jobs, stale_jobs = filter_fresh_jobs(snapshot['jobs'], time_filter)
+    if stale_jobs:
+        print(f"🗓️ Delta hunt: {len(stale_jobs)} previously analyzed job(s) went stale")
+        snapshot['jobs'] = fresh_jobs
+        snapshot['analysis'] = drop_match_sections(snapshot['analysis'], {j['href'] for j in stale_jobs})
+        snapshot['stale_urls'] += [j['href'] for j in stale_jobs]
+
+
+def page_raw_jobs(jobs, fields, page, page_size):
+    """Slice one page of jobs and keep only the requested fields."""
+    start = (page - 1) * page_size
+    return {
+        "raw_jobs": [{f: j.get(f) for f in fields} for j in jobs[start:start + page_size]],
+        "raw_jobs_total": len(jobs),
+        "page": page,
+        "page_size": page_size,
+        "has_more": start + page_size < len(jobs),
+    }
+
+
+def warm_up():
+    """
+    Optional warm-up, run in the background once the worker is serving
+    (see post_worker_init in gunicorn_config.py). Everything here is otherwise
+    initialized lazily by the first request that needs it.
+    """
+    started = time.monotonic()
+    get_seen_count()  # Creates the SQLite tables
+    warm_up_engine()
+    report_prompt_token_counts()  # Compiles every prompt template
+    import PyPDF2  # noqa: F401
+    print(f"🔥 Warm-up complete in {time.monotonic() - started:.2f}s")
+
+
+@app.before_request
+def maybe_start_profile():
+    """Opt-in request profiling (see job_profiler)."""
+    if request.method != 'OPTIONS' and should_profile(request.headers, request.path):
+        g.profile = start_profile(f"{request.method} {request.path}")
+
+
+@app.teardown_request
+def finish_failed_profile(exc):
+    """A request that raised never reached after_request — still save (and unlock) its profile."""
+    profile = g.pop('profile', None)
+    if profile:
+        finish_profile(profile, 500)
+
+
 @app.after_request
 def after_request(response):
     """Add CORS headers to every response"""
+    profile = g.pop('profile', None)
+    if profile:
+        finish_profile(profile, response.status_code)
+        response.headers['X-Profile-Id'] = profile['id']
     response.headers['Access-Control-Allow-Origin'] = '*'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type,Authorization'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type,Authorization,If-None-Match,X-Profile'
+    response.headers['Access-Control-Expose-Headers'] = 'ETag,X-Profile-Id,Retry-After'
     response.headers['Access-Control-Allow-Methods'] = 'GET,POST,OPTIONS'
     return response
 
@@ -135,14 +388,27 @@ def get_options():
     """Return dropdown data + memory stats"""
     if request.method == 'OPTIONS':
         return jsonify({})
-    return jsonify({
-        "job_roles": JOB_ROLES,
-        "locations": LOCATIONS,
-        "time_filters": TIME_FILTERS,
-        "job_types": JOB_TYPES,
-        "memory_count": get_seen_count(),
-        "has_resume": bool(USER_RESUME["text"].strip()),
-    })
+
+    memory_count = get_seen_count()
+    has_resume = bool(USER_RESUME["text"].strip())
+    etag = f"{OPTIONS_STATIC_VERSION}-{memory_count}-{int(has_resume)}"
+
+    # Compressed responses carry "<etag>:br" / "<etag>:gzip" — compare the base tag
+    client_tags = {tag.split(':')[0] for tag in request.if_none_match.as_set()}
+    if etag in client_tags:
+        response = app.response_class(status=304)
+    else:
+        response = jsonify({
+            "job_roles": JOB_ROLES,
+            "locations": LOCATIONS,
+            "time_filters": TIME_FILTERS,
+            "job_types": JOB_TYPES,
+            "memory_count": memory_count,
+            "has_resume": has_resume,
+        })
+    response.set_etag(etag)
+    response.cache_control.no_cache = True  # Always revalidate; 304 keeps it cheap
+    return response
 
 # --- Resume Endpoints ---
 @app.route('/api/resume', methods=['GET', 'POST', 'OPTIONS'])
@@ -176,6 +442,8 @@ def upload_resume():
         return jsonify({"error": "Only PDF files are supported"}), 400
     
     try:
+        import PyPDF2  # Deferred: only needed for uploads, slow to import at cold start
+
         # Read PDF and extract text
         pdf_bytes = io.BytesIO(file.read())
         reader = PyPDF2.PdfReader(pdf_bytes)
@@ -212,7 +480,46 @@ def clear_job_memory():
     clear_memory()
     return jsonify({"status": "cleared"})
 
+# --- Deep-read health ---
+@app.route('/api/deep-read/health', methods=['GET', 'OPTIONS'])
+def deep_read_health():
+    """Per-host circuit-breaker state for the Jina deep reader."""
+    if request.method == 'OPTIONS':
+        return jsonify({})
+    domains = get_domain_health()
+    return jsonify({
+        "open": sum(1 for d in domains if d["state"] == "open"),
+        "domains": domains,
+    })
+
+@app.route('/api/profiles', methods=['GET', 'OPTIONS'])
+def get_profiles():
+    """Recent request profiles (newest first). 404 unless PROFILING_ENABLED."""
+    if request.method == 'OPTIONS':
+        return jsonify({})
+    if not PROFILING_ENABLED:
+        return jsonify({"error": "Profiling is disabled (set PROFILING_ENABLED=1)"}), 404
+    return jsonify({"profiles": list_profiles()})
+
+
+@app.route('/api/profiles/<profile_id>', methods=['GET', 'OPTIONS'])
+def download_profile(profile_id):
+    """Download one profile: collapsed stacks by default, ?format=json for the summary."""
+    if request.method == 'OPTIONS':
+        return jsonify({})
+    if not PROFILING_ENABLED:
+        return jsonify({"error": "Profiling is disabled (set PROFILING_ENABLED=1)"}), 404
+    kind = request.args.get('format', 'folded')
+    path = get_profile_path(profile_id, kind)
+    if path is None:
+        return jsonify({"error": "Unknown profile"}), 404
+    if kind == 'json':
+        return send_file(path, mimetype='application/json')
+    return send_file(path, mimetype='text/plain', as_attachment=True, download_name=f"{profile_id}.folded")
+
+
 @app.route('/api/hunt', methods=['POST', 'OPTIONS'])
+@admission_controlled()
 def hunt_jobs():
     if request.method == 'OPTIONS':
         return jsonify({})
@@ -226,18 +533,47 @@ def hunt_jobs():
     if not all([job_title, location]):
         return jsonify({"error": "Missing required fields: job_title, location"}), 400
 
+    try:
+        deadline_seconds = parse_deadline_seconds(data)
+        fields, page, page_size = parse_raw_job_params(data)
+        prompt_variant = parse_prompt_variant(data)
+        deep_read_budget = parse_deep_read_budget(data)
+        since = parse_since(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    deep_read_budget, prompt_variant, service_mode = apply_service_mode(deep_read_budget, prompt_variant)
+
+    hunt_started = g.hunt_started  # Set on arrival by admission_controlled
+    deadline = make_deadline(deadline_seconds, started=hunt_started)
+    degraded = []  # Stages cut short by the deadline
+
     print(f"\n{'='*60}")
-    print(f"🕵️  HUNT: {job_title} in {location} (Filter: {time_filter}, Type: {job_type})")
+    print(f"🕵️  HUNT: {job_title} in {location} (Filter: {time_filter}, Type: {job_type}, Budget: {deadline_seconds:.0f}s)")
     print(f"{'='*60}")
 
     # --- STEP 1: Parallel Scout (job_type baked into queries) ---
-    raw_jobs = scout_for_jobs(job_title, location, time_filter, job_type=job_type)
+    raw_jobs = scout_for_jobs(job_title, location, time_filter, job_type=job_type,
+                              deadline=deadline, degraded=degraded)
+
+    # --- STEP 1b: Local corpus — fresh matches we scouted/deep-read in earlier hunts ---
+    scouted_urls = {j['href'] for j in raw_jobs}
+    corpus_jobs = [
+        j for j in search_corpus(query_keywords(job_title), location, corpus_since(time_filter), limit=CORPUS_MATCH_LIMIT)
+        if j['href'] not in scouted_urls
+    ]
+    if corpus_jobs:
+        print(f"📚 Corpus: {len(corpus_jobs)} extra match(es) from earlier hunts")
+        raw_jobs = raw_jobs + corpus_jobs
+
     if not raw_jobs:
         return jsonify({
             "jobs_found": 0,
             "new_jobs": 0,
-            "raw_jobs": [],
-            "analysis": "❌ No fresh jobs found. Try 'Past Month' filter or different search terms."
+            **page_raw_jobs([], fields, page, page_size),
+            "analysis": "❌ No fresh jobs found. Try 'Past Month' filter or different search terms.",
+            "service_mode": service_mode,
+            "degraded_stages": degraded,
+            "elapsed_seconds": round(time.monotonic() - hunt_started, 2),
         })
 
     # --- STEP 2: SQLite Dedup ---
@@ -248,52 +584,340 @@ def hunt_jobs():
     # Combine: new jobs first, then seen jobs
     all_jobs = new_jobs + seen_jobs
 
-    # --- STEP 3: Deep Reader ---
+    # --- STEP 2b: Delta mode (client sent a cursor) — only jobs not in the last analysis ---
+    resume_text = USER_RESUME.get("text", "")
+    hunt_key = make_hunt_key(job_title, location, time_filter, job_type, resume_text)
+    snapshot = get_hunt_snapshot(hunt_key) if since else None
+    if snapshot and datetime.fromisoformat(snapshot['analyzed_at']) < datetime.now() - DELTA_SNAPSHOT_MAX_AGE:
+        snapshot = None  # Base analysis too old — freshness labels have drifted, re-analyze everything
+    if snapshot:
+        prune_stale_snapshot(snapshot, time_filter)
+
+    delta = "full"
+    if snapshot:
+        # "New for this hunt" = not in its last analysis and not already rejected as stale,
+        # whether or not another hunt saw the job first
+        known_urls = {j['href'] for j in snapshot['jobs']} | set(snapshot['stale_urls'])
+        all_jobs = [j for j in all_jobs if j['href'] not in known_urls]
+        print(f"🔁 Delta hunt: {len(all_jobs)} job(s) not in the previous analysis")
+        if not all_jobs:
+            # Nothing new since the cursor — hand back the stored analysis, zero tokens
+            elapsed = time.monotonic() - hunt_started
+            print(f"✅ Hunt unchanged since {since} ({elapsed:.1f}s)")
+            print(f"{'='*60}\n")
+            return jsonify({
+                "hunt_id": snapshot['hunt_id'],
+                "cursor": datetime.now().isoformat(),
+                "delta": "unchanged",
+                "jobs_found": len(snapshot['jobs']),
+                "new_jobs": 0,
+                "seen_jobs": len(seen_jobs),
+                "stale_rejected": 0,
+                **page_raw_jobs(snapshot['jobs'], fields, page, page_size),
+                "analysis": snapshot['analysis'],
+                "service_mode": service_mode,
+                "degraded_stages": degraded,
+                "elapsed_seconds": round(elapsed, 2),
+            })
+        delta = "merged"
+
+    # --- STEP 3: Deep Reader — budget goes to the pages most likely to change the verdict ---
     if new_jobs:
-        all_jobs = deep_read_jobs(all_jobs, max_jobs=5)
+        all_jobs = deep_read_jobs(all_jobs, max_jobs=deep_read_budget, deadline=deadline, degraded=degraded,
+                                  job_title=job_title, time_filter=time_filter)
+
+    # --- STEP 3b: Local freshness check (no tokens spent on stale jobs) ---
+    all_jobs, stale_jobs = filter_fresh_jobs(all_jobs, time_filter)
+    if stale_jobs:
+        print(f"🗓️ Local date check rejected {len(stale_jobs)} stale job(s) outside {time_filter}")
+    corpus_updates = all_jobs + stale_jobs
 
     # --- STEP 4: AI Analysis with Resume + API Key Rotation (3 keys) ---
     # Pass ALL 3 keys to analyze_jobs_with_groq for automatic failover
     # It will try them sequentially if any hit rate limits
-    api_keys = {
-        "primary": GROQ_API_KEY,
-        "backup": GROQ_API_KEY_BACKUP,
-        "tertiary": GROQ_API_KEY_TERTIARY
-    }
+    api_keys = get_groq_api_keys()
     
-    resume_text = USER_RESUME.get("text", "")
     print(f"📋 Resume: {'Loaded (' + str(len(resume_text)) + ' chars)' if resume_text else 'Not provided'}")
     print(f"🔑 Using 3-key failover system (Keys available: {sum(1 for k in api_keys.values() if k)})")
     print(f"⚡ Analyzing {len(all_jobs)} results with Groq...")
 
-    analysis = analyze_jobs_with_groq(
-        all_jobs, job_title, location, api_keys,  # Pass all keys for failover
-        time_filter=time_filter,
-        resume_text=resume_text,
-        job_type=job_type
-    )
+    if all_jobs:
+        analysis = analyze_jobs_with_groq(
+            all_jobs, job_title, location, api_keys,  # Pass all keys for failover
+            time_filter=time_filter,
+            resume_text=resume_text,
+            job_type=job_type,
+            deadline=deadline,
+            degraded=degraded,
+            prompt_variant=prompt_variant,
+        )
+    else:
+        analysis = ALL_STALE_MESSAGE
+
+    if snapshot:
+        # Merge the new matches into the previous report; keep its jobs after the new ones
+        analysis = merge_analyses(analysis, snapshot['analysis']) if all_jobs else snapshot['analysis']
+        all_jobs = all_jobs + [{**j, "is_new": False} for j in snapshot['jobs']]
+        if len(all_jobs) > DELTA_SNAPSHOT_MAX_JOBS:
+            dropped = all_jobs[DELTA_SNAPSHOT_MAX_JOBS:]
+            all_jobs = all_jobs[:DELTA_SNAPSHOT_MAX_JOBS]
+            analysis = drop_match_sections(analysis, {j['href'] for j in dropped})
 
     # --- STEP 5: Store new jobs in memory ---
     # Remember jobs to avoid showing duplicates in future searches
     if new_jobs:
         mark_jobs_seen(new_jobs, job_title, location)
         print(f"💾 Stored {len(new_jobs)} new jobs in memory")
+    # Only live scout results count as sightings; corpus matches just keep what we learned about them
+    save_jobs_to_corpus([j for j in corpus_updates if j['href'] in scouted_urls], job_title, location)
+    update_corpus_reads([j for j in corpus_updates if j['href'] not in scouted_urls])
 
-    print(f"✅ Hunt complete! Total: {len(all_jobs)}, New: {len(new_jobs)}")
+    elapsed = time.monotonic() - hunt_started
+    print(f"✅ Hunt complete! Total: {len(all_jobs)}, New: {len(new_jobs)} ({elapsed:.1f}s)")
+    if degraded:
+        print(f"⏱️ Degraded stages: {', '.join(degraded)}")
     print(f"{'='*60}\n")
 
+    # Keep the full list server-side so clients can page through it / fetch bodies lazily
+    hunt_id = uuid.uuid4().hex
+    stored_jobs = [{f: j.get(f) for f in RAW_JOB_FIELDS} for j in all_jobs]
+    save_hunt_jobs(hunt_id, stored_jobs)
+
+    # Cursor is taken after mark_jobs_seen so this hunt's own jobs aren't "new" next time.
+    # A fallback (degraded) analysis is never snapshotted — the next poll retries Groq.
+    # A merge keeps its base analysis' timestamp, so DELTA_SNAPSHOT_MAX_AGE still forces a full re-run.
+    cursor = datetime.now().isoformat()
+    if "analysis" not in degraded:
+        stale_urls = (snapshot['stale_urls'] if snapshot else []) + [j['href'] for j in stale_jobs]
+        save_hunt_snapshot(hunt_key, hunt_id, analysis, cursor, snapshot['analyzed_at'] if snapshot else cursor, stale_urls)
+
     return jsonify({
+        "hunt_id": hunt_id,
+        "cursor": cursor,
+        "delta": delta,
         "jobs_found": len(all_jobs),
         "new_jobs": len(new_jobs),
         "seen_jobs": len(seen_jobs),
-        "raw_jobs": [{
-            "title": j["title"],
-            "href": j["href"],
-            "body": j["body"],
-            "is_new": j.get("is_new", True)
-        } for j in all_jobs],
-        "analysis": analysis
+        "stale_rejected": len(stale_jobs),
+        "corpus_matches": len(corpus_jobs),
+        **page_raw_jobs(stored_jobs, fields, page, page_size),
+        "analysis": analysis,
+        "service_mode": service_mode,
+        "degraded_stages": degraded,
+        "elapsed_seconds": round(elapsed, 2),
+    })
+
+
+@app.route('/api/hunt/batch', methods=['POST', 'OPTIONS'])
+@admission_controlled(slot_weight=batch_slot_weight)
+def hunt_jobs_batch():
+    """
+    Run several hunts in one request: {"hunts": [{job_title, location, job_type, time_filter}, ...]}.
+    Scouts run concurrently, each URL is deep-read once across the whole batch, and
+    hunts with the same time_filter + job_type share Groq calls.
+    """
+    if request.method == 'OPTIONS':
+        return jsonify({})
+
+    data = request.json or {}
+    combos = data.get('hunts')
+    if not isinstance(combos, list) or not combos:
+        return jsonify({"error": "hunts must be a non-empty list"}), 400
+    if len(combos) > MAX_BATCH_HUNTS:
+        return jsonify({"error": f"At most {MAX_BATCH_HUNTS} hunts per batch"}), 400
+
+    hunts = []
+    for i, combo in enumerate(combos):
+        if not isinstance(combo, dict) or not all([combo.get('job_title'), combo.get('location')]):
+            return jsonify({"error": f"hunts[{i}] is missing required fields: job_title, location"}), 400
+        hunts.append({
+            "job_title": combo['job_title'],
+            "location": combo['location'],
+            "time_filter": combo.get('time_filter', 'past_week'),
+            "job_type": combo.get('job_type', 'any'),
+        })
+
+    try:
+        deadline_seconds = parse_deadline_seconds(data)
+        fields, page, page_size = parse_raw_job_params(data)
+        prompt_variant = parse_prompt_variant(data)
+        deep_read_budget = parse_deep_read_budget(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    deep_read_budget, prompt_variant, service_mode = apply_service_mode(deep_read_budget, prompt_variant)
+
+    hunt_started = g.hunt_started  # Set on arrival by admission_controlled
+    deadline = make_deadline(deadline_seconds, started=hunt_started)
+    degraded = []
+
+    print(f"\n{'='*60}")
+    print(f"🕵️  BATCH HUNT: {len(hunts)} combos (Budget: {deadline_seconds:.0f}s)")
+    print(f"{'='*60}")
+
+    # --- STEP 1: Concurrent Scouts ---
+    def scout(hunt):
+        return scout_for_jobs(hunt['job_title'], hunt['location'], hunt['time_filter'],
+                              job_type=hunt['job_type'], deadline=deadline, degraded=degraded)
+
+    with ThreadPoolExecutor(max_workers=min(len(hunts), 4)) as executor:
+        scouted = list(executor.map(scout, hunts))
+
+    # --- STEP 2: Cross-batch URL dedup + SQLite memory ---
+    pool = {}  # href -> job dict shared by every hunt that found it
+    for hunt, raw_jobs in zip(hunts, scouted):
+        hunt['urls'] = []
+        for job in raw_jobs:
+            pool.setdefault(job['href'], job)
+            if job['href'] not in hunt['urls']:
+                hunt['urls'].append(job['href'])
+
+    filter_new_jobs(list(pool.values()))
+    print(f"💾 Batch pool: {len(pool)} unique URLs across {len(hunts)} hunts")
+
+    # --- STEP 3: Deep Reader — each URL at most once ---
+    to_read, to_read_urls = [], set()
+    for hunt in hunts:
+        jobs = [pool[url] for url in hunt['urls']]
+        # New jobs first, then seen jobs (same order as a single hunt)
+        hunt['jobs'] = [j for j in jobs if j['is_new']] + [j for j in jobs if not j['is_new']]
+        if any(j['is_new'] for j in jobs):
+            for job in select_deep_read_targets(hunt['jobs'], hunt['job_title'], hunt['time_filter'], deep_read_budget):
+                if job['href'] not in to_read_urls:
+                    to_read_urls.add(job['href'])
+                    to_read.append(job)
+    if to_read:
+        deep_read_jobs(to_read, max_jobs=len(to_read), deadline=deadline, degraded=degraded)
+    for job in pool.values():
+        job.setdefault('full_content', job.get('body', ''))
+
+    # --- STEP 3b: Local freshness check (per hunt — time filters may differ) ---
+    for hunt in hunts:
+        hunt['jobs'], hunt['stale'] = filter_fresh_jobs(hunt['jobs'], hunt['time_filter'])
+
+    # --- STEP 4: Packed AI Analysis — compatible hunts share a prompt ---
+    groups = {}
+    for idx, hunt in enumerate(hunts):
+        if hunt['jobs']:
+            groups.setdefault((hunt['time_filter'], hunt['job_type']), []).append(idx)
+        else:
+            hunt['analysis'] = ALL_STALE_MESSAGE if hunt['stale'] else "❌ No fresh jobs found. Try 'Past Month' filter or different search terms."
+
+    api_keys = get_groq_api_keys()
+    resume_text = USER_RESUME.get("text", "")
+
+    def analyze_group(item):
+        (time_filter, job_type), idxs = item
+        analyses, llm_calls = analyze_job_batch_with_groq(
+            [hunts[i] for i in idxs], api_keys,
+            time_filter=time_filter, resume_text=resume_text, job_type=job_type,
+            deadline=deadline, degraded=degraded, prompt_variant=prompt_variant,
+        )
+        for i, analysis in zip(idxs, analyses):
+            hunts[i]['analysis'] = analysis
+        return llm_calls
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        total_llm_calls = sum(executor.map(analyze_group, groups.items()))
+
+    # --- STEP 5: Store new jobs in memory + per-hunt results ---
+    results = []
+    for hunt in hunts:
+        new_jobs = [pool[url] for url in hunt['urls'] if pool[url]['is_new']]
+        if new_jobs:
+            mark_jobs_seen(new_jobs, hunt['job_title'], hunt['location'])
+        save_jobs_to_corpus(hunt['jobs'] + hunt['stale'], hunt['job_title'], hunt['location'])
+
+        hunt_id = uuid.uuid4().hex
+        stored_jobs = [{f: j.get(f) for f in RAW_JOB_FIELDS} for j in hunt['jobs']]
+        save_hunt_jobs(hunt_id, stored_jobs)
+        results.append({
+            "hunt_id": hunt_id,
+            "job_title": hunt['job_title'],
+            "location": hunt['location'],
+            "time_filter": hunt['time_filter'],
+            "job_type": hunt['job_type'],
+            "jobs_found": len(hunt['jobs']),
+            "new_jobs": len(new_jobs),
+            "seen_jobs": len(hunt['urls']) - len(new_jobs),
+            "stale_rejected": len(hunt['stale']),
+            **page_raw_jobs(stored_jobs, fields, page, page_size),
+            "analysis": hunt['analysis'],
+        })
+
+    elapsed = time.monotonic() - hunt_started
+    print(f"✅ Batch complete! {len(hunts)} hunts, {len(pool)} URLs, {len(to_read)} deep reads, {total_llm_calls} Groq call(s) ({elapsed:.1f}s)")
+    print(f"{'='*60}\n")
+
+    return jsonify({
+        "results": results,
+        "unique_urls": len(pool),
+        "deep_reads": len(to_read),
+        "llm_calls": total_llm_calls,
+        "service_mode": service_mode,
+        "degraded_stages": degraded,
+        "elapsed_seconds": round(elapsed, 2),
+    })
+
+
+@app.route('/api/hunt/instant', methods=['POST', 'OPTIONS'])
+def hunt_jobs_instant():
+    """
+    Corpus-only hunt: fresh matches from jobs earlier hunts already scouted, ranked
+    locally in milliseconds. Call it alongside /api/hunt to show results while the
+    live scout runs (no Tavily, Jina or Groq calls).
+    """
+    if request.method == 'OPTIONS':
+        return jsonify({})
+
+    data = request.json or {}
+    job_title = data.get('job_title')
+    location = data.get('location')
+    time_filter = data.get('time_filter', 'past_week')
+    job_type = data.get('job_type', 'any')
+    if not all([job_title, location]):
+        return jsonify({"error": "Missing required fields: job_title, location"}), 400
+    try:
+        fields, page, page_size = parse_raw_job_params(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    started = time.monotonic()
+    jobs = search_corpus(query_keywords(job_title), location, corpus_since(time_filter), limit=INSTANT_MATCH_LIMIT)
+    jobs, _ = filter_fresh_jobs(jobs, time_filter)
+    for job in jobs:
+        job['is_new'] = False  # Everything in the corpus came from an earlier hunt
+    analysis = rank_jobs_locally(
+        jobs, job_title, location, time_filter=time_filter,
+        resume_text=USER_RESUME.get("text", ""), job_type=job_type,
+        reason="Instant results from jobs found in earlier hunts; the live search may add more",
+    )
+    stored_jobs = [{f: j.get(f) for f in RAW_JOB_FIELDS} for j in jobs]
+    return jsonify({
+        "source": "corpus",
+        "jobs_found": len(jobs),
+        **page_raw_jobs(stored_jobs, fields, page, page_size),
+        "analysis": analysis,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
     })
 
+
+@app.route('/api/hunt/<hunt_id>/jobs', methods=['GET', 'OPTIONS'])
+def get_hunt_job_page(hunt_id):
+    """Page through a previous hunt's raw jobs, e.g. ?page=2&fields=title,href,body"""
+    if request.method == 'OPTIONS':
+        return jsonify({})
+
+    try:
+        fields, page, page_size = parse_raw_job_params(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    jobs = get_hunt_jobs(hunt_id)
+    if jobs is None:
+        return jsonify({"error": "Unknown or expired hunt_id"}), 404
+
+    return jsonify({"hunt_id": hunt_id, **page_raw_jobs(jobs, fields, page, page_size)})
+
 if __name__ == '__main__':
+    report_prompt_token_counts()
     app.run(debug=True, port=5001, host='0.0.0.0')
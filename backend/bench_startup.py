@@ -0,0 +1,84 @@
+"""
+Cold-Start Benchmark — import time + time to first /api/options response.
+
+Every run is a fresh interpreter, so nothing is warm. Uses a throwaway SQLite
+file so the real jobs.db is never touched.
+
+Usage:
+    python backend/bench_startup.py --runs 5 --max-import-ms 400 --max-first-response-ms 600
+
+Exits with status 1 if a median is over its threshold, so it can guard CI
+against cold-start regressions.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Runs inside the fresh interpreter
+CHILD_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+response = app.app.test_client().get('/api/options')
+answered = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (answered - started) * 1000,
+    "status": response.status_code,
+}))
+"""
+
+
+def run_once(db_path):
+    env = dict(os.environ, JOBS_DB_PATH=db_path, WARM_UP_ON_START="0")
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    # app prints banners to stdout — the measurement is the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-first-response-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.runs):
+            # New DB per run: first request also pays table creation, like a fresh instance
+            sample = run_once(os.path.join(tmp, f"bench_{i}.db"))
+            if sample["status"] != 200:
+                print(f"❌ /api/options returned {sample['status']}")
+                return 1
+            samples.append(sample)
+
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    first_ms = statistics.median(s["first_response_ms"] for s in samples)
+    print(f"⏱️ Cold start over {args.runs} runs (median):")
+    print(f"   import app:            {import_ms:7.1f} ms")
+    print(f"   first /api/options:    {first_ms:7.1f} ms")
+
+    failed = False
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"❌ Import time {import_ms:.1f} ms exceeds {args.max_import_ms:.0f} ms")
+        failed = True
+    if args.max_first_response_ms is not None and first_ms > args.max_first_response_ms:
+        print(f"❌ First response {first_ms:.1f} ms exceeds {args.max_first_response_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
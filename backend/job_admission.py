@@ -0,0 +1,86 @@
+"""
+Admission Control — Concurrency Limits + Bounded Queue for Hunts
+
+Hunts are the expensive endpoints (Tavily + Jina + Groq), so each one must
+hold a slot. Slots live in SQLite so both gunicorn workers share the limits:
+- At most MAX_CONCURRENT_HUNTS hunts run at once (all workers); a batch counts
+  as one hunt per combo (capped at MAX_CONCURRENT_HUNTS so it can still run)
+- At most MAX_HUNTS_PER_CLIENT running or queued per client → else 429
+- Up to MAX_QUEUED_HUNTS wait (FIFO) for QUEUE_WAIT_SECONDS → else 503
+
+Rejections are immediate and carry Retry-After, so overload sheds load
+predictably instead of every request timing out.
+"""
+
+import os
+import time
+import uuid
+
+from job_memory import claim_hunt_slot, release_hunt_slot
+
+MAX_CONCURRENT_HUNTS = int(os.environ.get("MAX_CONCURRENT_HUNTS", "4"))
+MAX_HUNTS_PER_CLIENT = int(os.environ.get("MAX_HUNTS_PER_CLIENT", "1"))
+MAX_QUEUED_HUNTS = int(os.environ.get("MAX_QUEUED_HUNTS", "8"))
+QUEUE_WAIT_SECONDS = float(os.environ.get("QUEUE_WAIT_SECONDS", "5"))
+QUEUE_POLL_SECONDS = 0.1
+
+# Retry-After hints (seconds)
+CLIENT_LIMIT_RETRY_AFTER = 5
+OVERLOADED_RETRY_AFTER = 10
+
+
+def get_client_id(remote_addr):
+    """
+    Client key for the per-client limit: the peer IP as Flask sees it. Behind a
+    proxy, ProxyFix (TRUSTED_PROXY_HOPS in app.py) has already resolved it from
+    X-Forwarded-For; headers the client controls are never used directly.
+    """
+    return remote_addr or "unknown"
+
+
+def admit_hunt(client_id, weight=1):
+    """
+    Wait (bounded) for `weight` hunt slots (1 for a single hunt, one per combo for a batch).
+    Returns (slot_id, None) when admitted, or (None, rejection) where rejection
+    is {"status": 429|503, "error": str, "retry_after": seconds}.
+    """
+    slot_id = uuid.uuid4().hex
+    weight = max(1, min(weight, MAX_CONCURRENT_HUNTS))
+    give_up_at = time.monotonic() + QUEUE_WAIT_SECONDS
+    queued = False
+    while True:
+        status = claim_hunt_slot(slot_id, client_id, MAX_CONCURRENT_HUNTS, MAX_HUNTS_PER_CLIENT, MAX_QUEUED_HUNTS, weight)
+        if status == "running":
+            if queued:
+                print(f"🚦 Admitted {client_id} after queueing")
+            return slot_id, None
+        if status == "client_limit":
+            print(f"🚦 Rejected {client_id}: already has {MAX_HUNTS_PER_CLIENT} hunt(s) in flight")
+            return None, {
+                "status": 429,
+                "error": f"Too many hunts in flight for this client (max {MAX_HUNTS_PER_CLIENT}). Try again shortly.",
+                "retry_after": CLIENT_LIMIT_RETRY_AFTER,
+            }
+        if status == "queue_full":
+            print(f"🚦 Rejected {client_id}: queue full ({MAX_QUEUED_HUNTS} waiting)")
+            return None, {
+                "status": 503,
+                "error": "Server is busy — all hunt slots and the wait queue are full. Try again shortly.",
+                "retry_after": OVERLOADED_RETRY_AFTER,
+            }
+
+        queued = True
+        if time.monotonic() >= give_up_at:
+            release_hunt_slot(slot_id)
+            print(f"🚦 Rejected {client_id}: no slot within {QUEUE_WAIT_SECONDS:.0f}s")
+            return None, {
+                "status": 503,
+                "error": f"Server is busy — no hunt slot freed up within {QUEUE_WAIT_SECONDS:.0f}s. Try again shortly.",
+                "retry_after": OVERLOADED_RETRY_AFTER,
+            }
+        time.sleep(QUEUE_POLL_SECONDS)
+
+
+def release_hunt(slot_id):
+    """Give the slot back once the hunt has finished (success or not)."""
+    release_hunt_slot(slot_id)
@@ -0,0 +1,265 @@
+"""
+Local Posting-Date Extractor — Freshness Check Without the LLM
+
+Parses "posted" dates out of snippets and deep-read pages so stale jobs are
+dropped BEFORE they cost Groq tokens. Handles:
+- Structured fields: JSON-LD "datePosted", meta published_time, Jina's "Published Time:"
+- Relative phrases: "just now", "3 days ago", "yesterday", "30+ days ago", "2w ago"
+- Absolute dates: 2026-02-11, 11 February 2026, Feb 11, 2026, 02/11/2026
+
+Jobs with no parseable date are kept — the model still gets the final say on them.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+# How far back each time_filter reaches (days)
+TIME_FILTER_DAYS = {
+    "past_day": 1,
+    "past_week": 7,
+    "past_month": 30,
+}
+
+# Slack for timezone differences and "1 day ago" meaning up to ~47 hours
+FRESHNESS_GRACE = timedelta(hours=12)
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+UNIT_DELTAS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+UNIT_ALIASES = {
+    "m": "minute", "min": "minute", "mins": "minute", "minute": "minute", "minutes": "minute",
+    "h": "hour", "hr": "hour", "hrs": "hour", "hour": "hour", "hours": "hour",
+    "d": "day", "day": "day", "days": "day",
+    "w": "week", "wk": "week", "wks": "week", "week": "week", "weeks": "week",
+    "mo": "month", "mos": "month", "month": "month", "months": "month",
+    "y": "year", "yr": "year", "yrs": "year", "year": "year", "years": "year",
+}
+
+# --- Structured fields (most trustworthy) ---
+STRUCTURED_DATE_PATTERN = re.compile(
+    r'(?:"datePosted"\s*:\s*"|'
+    r'(?:article:published_time|og:published_time|datePublished)"?\s*(?:content=|:)\s*"|'
+    r'Published Time:\s*)'
+    r'(\d{4}-\d{2}-\d{2})(?:[T ](\d{2}:\d{2}))?',
+    re.IGNORECASE,
+)
+
+# --- Relative phrases ---
+RELATIVE_PATTERN = re.compile(
+    r'\b(\d+|an?|one)\s*(\+)?\s*'
+    r'(minutes?|mins?|hours?|hrs?|days?|weeks?|wks?|months?|mos?|years?|yrs?|[mhdwy])\s+ago\b',
+    re.IGNORECASE,
+)
+THIRTY_PLUS_PATTERN = re.compile(r'\b30\+\s*days\b', re.IGNORECASE)
+TODAY_PATTERN = re.compile(
+    r'\b(just now|just posted|moments ago|few hours ago|(posted|listed|published|active)\s*:?\s*today)\b',
+    re.IGNORECASE,
+)
+YESTERDAY_PATTERN = re.compile(r'\byesterday\b', re.IGNORECASE)
+
+# --- Absolute dates ---
+ISO_DATE_PATTERN = re.compile(r'\b(20\d{2})-(\d{2})-(\d{2})\b')
+DAY_MONTH_YEAR_PATTERN = re.compile(
+    r'\b(\d{1,2})(?:st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+(20\d{2})\b',
+    re.IGNORECASE,
+)
+MONTH_DAY_YEAR_PATTERN = re.compile(
+    r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(20\d{2})\b',
+    re.IGNORECASE,
+)
+# 10/01/2026 or 10.01.2026 — month/day order is ambiguous, see _numeric_date
+NUMERIC_DATE_PATTERN = re.compile(r'\b(\d{1,2})[/.](\d{1,2})[/.](20\d{2})\b')
+YEAR_FIRST_NUMERIC_PATTERN = re.compile(r'\b(20\d{2})/(\d{1,2})/(\d{1,2})\b')
+
+# Only trust absolute dates that sit next to a "posted"-style word (avoids start dates, deadlines, copyright years)
+POSTED_CONTEXT_PATTERN = re.compile(r'(posted|published|date posted|listed|updated|posting date)', re.IGNORECASE)
+POSTED_CONTEXT_WINDOW = 40
+
+
+def _utc(year, month, day, hour=0, minute=0):
+    """Build a UTC datetime, or None for impossible dates (e.g. Feb 30)."""
+    try:
+        return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def _parse_structured(text):
+    match = STRUCTURED_DATE_PATTERN.search(text)
+    if not match:
+        return None
+    year, month, day = (int(p) for p in match.group(1).split("-"))
+    hour, minute = (int(p) for p in match.group(2).split(":")) if match.group(2) else (0, 0)
+    return _utc(year, month, day, hour, minute)
+
+
+def _has_posted_context(text, start):
+    return bool(POSTED_CONTEXT_PATTERN.search(text[max(0, start - POSTED_CONTEXT_WINDOW):start]))
+
+
+def _parse_relative(text, now, require_context=True):
+    """
+    "N units ago" / "30+ days" phrases only count with a "posted"-style word
+    shortly before them — "Founded 10 years ago" or "Series B 3 months ago" is
+    not a posting date. With require_context=False the first phrase anywhere
+    is used: a weak signal for deep-read selection, never a reason to reject.
+    """
+    fallback = None
+    for match in RELATIVE_PATTERN.finditer(text):
+        amount_text, _, unit_text = match.groups()
+        amount = 1 if amount_text.lower() in ("a", "an", "one") else int(amount_text)
+        unit = UNIT_ALIASES.get(unit_text.lower())
+        if not unit:
+            continue
+        parsed = now - amount * UNIT_DELTAS[unit]
+        if _has_posted_context(text, match.start()):
+            return parsed
+        if fallback is None:
+            fallback = parsed
+    for match in THIRTY_PLUS_PATTERN.finditer(text):
+        if _has_posted_context(text, match.start()):
+            return now - timedelta(days=30)
+        if fallback is None:
+            fallback = now - timedelta(days=30)
+    if fallback is not None and not require_context:
+        return fallback
+    if YESTERDAY_PATTERN.search(text):
+        return now - timedelta(days=1)
+    if TODAY_PATTERN.search(text):
+        return now
+    return None
+
+
+def _numeric_date(first, second, year, now):
+    """
+    Both readings of an all-numeric date (MM/DD and DD/MM); the most recent
+    one that isn't in the future wins, since postings are never ahead of today.
+    """
+    readings = [_utc(year, first, second), _utc(year, second, first)]
+    valid = [d for d in readings if d and d <= now + timedelta(days=1)]
+    return max(valid) if valid else None
+
+
+def _parse_absolute(text, now):
+    """First absolute date that has a "posted"-style word shortly before it."""
+    candidates = []
+    for match in ISO_DATE_PATTERN.finditer(text):
+        year, month, day = (int(g) for g in match.groups())
+        candidates.append((match.start(), _utc(year, month, day)))
+    for match in DAY_MONTH_YEAR_PATTERN.finditer(text):
+        day, month, year = match.groups()
+        candidates.append((match.start(), _utc(int(year), MONTHS[month[:3].lower()], int(day))))
+    for match in MONTH_DAY_YEAR_PATTERN.finditer(text):
+        month, day, year = match.groups()
+        candidates.append((match.start(), _utc(int(year), MONTHS[month[:3].lower()], int(day))))
+    for match in NUMERIC_DATE_PATTERN.finditer(text):
+        first, second, year = (int(g) for g in match.groups())
+        candidates.append((match.start(), _numeric_date(first, second, year, now)))
+    for match in YEAR_FIRST_NUMERIC_PATTERN.finditer(text):
+        year, month, day = (int(g) for g in match.groups())
+        candidates.append((match.start(), _utc(year, month, day)))
+
+    for start, parsed in sorted(candidates, key=lambda c: c[0]):
+        if parsed and _has_posted_context(text, start):
+            return parsed
+    return None
+
+
+def extract_posted_at(text, now=None):
+    """
+    Best-effort posting date for one page/snippet.
+
+    Returns a timezone-aware UTC datetime, or None if nothing parseable was found.
+    Order of trust: structured fields > absolute date near "posted" > relative phrase near "posted".
+    """
+    if not text:
+        return None
+    now = now or datetime.now(timezone.utc)
+
+    posted_at = _parse_structured(text) or _parse_absolute(text, now) or _parse_relative(text, now)
+    if posted_at and posted_at > now + timedelta(days=1):
+        return None  # Future date — a start date or deadline, not a posting date
+    return posted_at
+
+
+def date_signals(text, now=None):
+    """
+    Every posting date each parser finds on its own, as [(kind, datetime)].
+    kind is "structured", "absolute", "relative" or "weak_relative" (an "N units
+    ago" with no "posted"-style word — extract_posted_at ignores it). Used to
+    spot conflicting cues.
+    """
+    if not text:
+        return []
+    now = now or datetime.now(timezone.utc)
+    signals = []
+    for kind, parsed in (
+        ("structured", _parse_structured(text)),
+        ("absolute", _parse_absolute(text, now)),
+        ("relative", _parse_relative(text, now)),
+    ):
+        if parsed and parsed <= now + timedelta(days=1):
+            signals.append((kind, parsed))
+    if not any(kind == "relative" for kind, _ in signals):
+        weak = _parse_relative(text, now, require_context=False)
+        if weak and weak <= now + timedelta(days=1):
+            signals.append(("weak_relative", weak))
+    return signals
+
+
+def _stored_posted_at(job):
+    try:
+        return datetime.fromisoformat(job['posted_at']) if job.get('posted_at') else None
+    except (TypeError, ValueError):
+        return None
+
+
+def filter_fresh_jobs(jobs, time_filter="past_week", now=None):
+    """
+    Run the extractor over the whole batch (after deep read) and split it.
+
+    Returns (fresh_jobs, stale_jobs):
+    - fresh_jobs: inside the time_filter window, or undated. Dated ones get
+      `posted_at` (ISO string) and `age_days`.
+    - stale_jobs: parsed date is outside the window.
+
+    A `posted_at` set by an earlier pass (stored snapshot / corpus jobs) wins:
+    re-reading "2 days ago" in stored text against today would make old jobs look fresh.
+    """
+    now = now or datetime.now(timezone.utc)
+    window = timedelta(days=TIME_FILTER_DAYS.get(time_filter, 7)) + FRESHNESS_GRACE
+    cutoff = now - window
+
+    fresh_jobs = []
+    stale_jobs = []
+    for job in jobs:
+        # Earlier pass first, then deep-read content, then the snippet if the page had no date
+        posted_at = (
+            _stored_posted_at(job)
+            or extract_posted_at(job.get('full_content', ''), now)
+            or extract_posted_at(f"{job.get('title', '')} {job.get('body', '')}", now)
+        )
+        if posted_at is None:
+            job['posted_at'] = None
+            fresh_jobs.append(job)
+            continue
+
+        job['posted_at'] = posted_at.isoformat()
+        job['age_days'] = round((now - posted_at).total_seconds() / 86400, 1)
+        if posted_at < cutoff:
+            stale_jobs.append(job)
+        else:
+            fresh_jobs.append(job)
+
+    return fresh_jobs, stale_jobs
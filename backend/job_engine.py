@@ -1,15 +1,96 @@
-import datetime
 import re
-import requests
+import time
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tavily import TavilyClient
-from groq import Groq
-from job_memory import filter_new_jobs, mark_jobs_seen
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+from job_memory import (
+    allow_deep_read, record_deep_read_result,
+    record_groq_usage, get_groq_usage_since, save_groq_quota_snapshot, get_groq_quota_snapshot,
+)
+from job_dates import date_signals, extract_posted_at, TIME_FILTER_DAYS
+from job_prompts import PROMPT_VARIANT, get_system_prompt, build_user_prompt, build_batch_user_prompt, estimate_tokens
+
+# NOTE: tavily, groq and requests are imported inside the functions that use them.
+# They account for most of the cold-start import time on Render.
+
+# Tavily client — built on first use (after .env is loaded), see get_tavily_client()
+_tavily_client = None
+_tavily_lock = threading.Lock()
+
+
+def get_tavily_client():
+    """Return the shared TavilyClient, creating it on first use. None if no key is configured."""
+    global _tavily_client
+    if _tavily_client is None:
+        with _tavily_lock:
+            api_key = os.environ.get("TAVILY_API_KEY")
+            if _tavily_client is None and api_key:
+                from tavily import TavilyClient
+                _tavily_client = TavilyClient(api_key=api_key)
+    return _tavily_client
+
+
+def warm_up():
+    """Pay the heavy imports and client setup up front (called after the port is bound)."""
+    import requests  # noqa: F401
+    import groq  # noqa: F401
+    get_tavily_client()
+
+# ==========================================
+# LATENCY BUDGET (per-hunt deadline)
+# ==========================================
+# End-to-end budget for a single hunt (SLO: 15s p99). Requests may override it.
+HUNT_DEADLINE_SECONDS = float(os.environ.get("HUNT_DEADLINE_SECONDS", "15"))
+
+# Seconds held back for the Groq stage while scout / deep read are running
+ANALYSIS_RESERVE_SECONDS = float(os.environ.get("ANALYSIS_RESERVE_SECONDS", "6"))
+
+# Below this much remaining time, don't even start a Groq call
+ANALYSIS_MIN_SECONDS = 1.0
+
+# Deep read: per-page timeout cap, delay before a hedged duplicate fetch, hedge cap per hunt
+DEEP_READ_TIMEOUT = 8
+DEEP_READ_HEDGE_AFTER = float(os.environ.get("DEEP_READ_HEDGE_AFTER", "2.5"))
+DEEP_READ_MAX_HEDGES = 2
+
+# A host that hasn't answered within this long counts as a breaker failure, however
+# much of the hunt budget was left (slow/hanging hosts must be able to trip it)
+DEEP_READ_HOST_ALLOWANCE = DEEP_READ_HEDGE_AFTER
+
+
+def make_deadline(seconds=None, started=None):
+    """
+    Return an absolute (monotonic) deadline `seconds` after `started` (default: now).
+    Defaults to HUNT_DEADLINE_SECONDS.
+    """
+    if seconds is None:
+        seconds = HUNT_DEADLINE_SECONDS
+    if started is None:
+        started = time.monotonic()
+    return started + seconds
+
+
+def time_left(deadline):
+    """Seconds remaining before `deadline`, or None if the hunt is unbounded."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+# Scout / deep-read / analysis pools share one `degraded` list per hunt
+_degraded_lock = threading.Lock()
+
+
+def _mark_degraded(degraded, stage):
+    """Record a stage that was cut short by the deadline (no-op if caller isn't tracking)."""
+    if degraded is None:
+        return
+    with _degraded_lock:
+        if stage not in degraded:
+            degraded.append(stage)
 
-# Initialize Tavily client
-TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY")
-tavily_client = TavilyClient(api_key=TAVILY_API_KEY) if TAVILY_API_KEY else None
 
 # Time limit mapping
 TIME_LIMITS = {
@@ -249,55 +330,440 @@ def is_search_page(url):
 # ==========================================
 # UPGRADE 1: DEEP READER (Jina AI)
 # ==========================================
-def fetch_full_job_content(url):
+# Stop streaming a page after this many characters even if signals are still missing
+DEEP_READ_MAX_CHARS = 20000
+
+# Size of the compact record kept per page (replaces the old blind text[:1500] prefix)
+DEEP_READ_RECORD_CHARS = 1500
+
+# Max requirement lines kept per page
+MAX_REQUIREMENT_LINES = 8
+
+# Scout raw mode: Tavily returns page content in the search call, so Jina is only
+# needed for results whose raw content is missing or thinner than this
+SCOUT_RAW_CONTENT = os.environ.get("SCOUT_RAW_CONTENT", "1") == "1"
+RAW_CONTENT_MIN_CHARS = 300
+
+# Line-level signals worth keeping from a job page
+DATE_LINE_PATTERN = re.compile(
+    r'(posted|published|date posted|listed on|updated|\bago\b|\btoday\b|yesterday|just now|'
+    r'\b20\d\d-\d\d-\d\d\b|\b\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b)',
+    re.IGNORECASE,
+)
+JOB_TYPE_LINE_PATTERN = re.compile(
+    r'(full[- ]time|part[- ]time|\bintern(ship)?\b|\bcontract\b|freelance|temporary|permanent|'
+    r'employment type|job type)',
+    re.IGNORECASE,
+)
+STATUS_LINE_PATTERN = re.compile(
+    r'(no longer (accepting|available)|not accepting applications|job (has )?expired|has expired|'
+    r'position (has been )?filled|job is closed|this job is closed|deadline has passed|'
+    r'actively hiring|accepting applications|apply now|easy apply)',
+    re.IGNORECASE,
+)
+# Closed banners only — anchored phrases, so "Salary: Not Disclosed", "fulfilled", "closed-loop" don't match
+CLOSED_STATUS_PATTERN = re.compile(
+    r'\b(no longer (accepting|available|open|active)|not accepting (applications|candidates)|'
+    r'(job|position|posting|listing|role|vacancy) (has |is )?(expired|closed|been filled|filled)|'
+    r'applications? (are |is |have )?closed|deadline has passed|status:\s*(closed|expired|filled))\b',
+    re.IGNORECASE,
+)
+REQUIREMENTS_HEADING_PATTERN = re.compile(
+    r'^[#*\s]*(requirements|qualifications|minimum qualifications|preferred qualifications|'
+    r'what you.ll need|what we.re looking for|who you are|skills|must have|you have)\b',
+    re.IGNORECASE,
+)
+
+
+def _is_boilerplate_line(line):
+    """Navigation links, images, separators and other markdown chrome from the reader output."""
+    if len(line) < 3:
+        return True
+    if line.startswith(("![", "[![", "---", "===", "|")):
+        return True
+    # A line that is nothing but one or more markdown links (menus, footers, breadcrumbs)
+    if re.fullmatch(r'(\*\s*|-\s*)?(\[[^\]]*\]\([^)]*\)\s*[|·•/>-]*\s*)+', line):
+        return True
+    return False
+
+
+def new_job_record():
+    """Empty section-aware record for one deep-read page."""
+    return {
+        "title": "",
+        "posted": [],
+        "type": [],
+        "status": [],
+        "requirements": [],
+        "summary": [],
+        "in_requirements": False,
+    }
+
+
+def add_line_to_record(record, line):
+    """Route one line of page text into the record section it belongs to."""
+    line = line.strip()
+    if not line:
+        return
+
+    # Jina's header block: "Title: ...", "Published Time: ..."
+    if line.startswith("Title:") and not record["title"]:
+        record["title"] = line[len("Title:"):].strip()[:200]
+        return
+    if line.startswith("Published Time:"):
+        record["posted"].append(line[:200])
+        return
+    if line.startswith(("URL Source:", "Markdown Content:")):
+        return
+    if _is_boilerplate_line(line):
+        return
+
+    text = line.lstrip("#*-• ").strip()[:200]
+
+    if REQUIREMENTS_HEADING_PATTERN.match(line):
+        record["in_requirements"] = True
+        return
+    if record["in_requirements"]:
+        if line.startswith("#") or (line.startswith("**") and line.endswith("**")):
+            record["in_requirements"] = False  # Next section started
+        elif len(record["requirements"]) < MAX_REQUIREMENT_LINES:
+            record["requirements"].append(text)
+            return
+
+    if STATUS_LINE_PATTERN.search(line) and len(record["status"]) < 3:
+        record["status"].append(text)
+    if DATE_LINE_PATTERN.search(line) and len(line) < 200 and len(record["posted"]) < 3:
+        record["posted"].append(text)
+    elif JOB_TYPE_LINE_PATTERN.search(line) and len(line) < 200 and len(record["type"]) < 2:
+        record["type"].append(text)
+    elif len(record["summary"]) < 4 and len(text) > 40:
+        record["summary"].append(text)
+
+
+def record_has_enough(record):
+    """True once streaming further is unlikely to change the freshness/status decision."""
+    if any(CLOSED_STATUS_PATTERN.search(s) for s in record["status"]):
+        return True  # Closed banner found — nothing else matters
+    requirements_done = len(record["requirements"]) >= MAX_REQUIREMENT_LINES or (
+        record["requirements"] and not record["in_requirements"]
+    )
+    return bool(record["title"] and record["posted"] and record["type"] and requirements_done)
+
+
+def format_job_record(record, limit=DEEP_READ_RECORD_CHARS):
+    """Render the record as compact labelled text for the prompt (and the stale filters)."""
+    parts = []
+    if record["title"]:
+        parts.append(f"TITLE: {record['title']}")
+    if record["posted"]:
+        parts.append("POSTED: " + " | ".join(record["posted"]))
+    if record["type"]:
+        parts.append("JOB TYPE: " + " | ".join(record["type"]))
+    if record["status"]:
+        parts.append("STATUS: " + " | ".join(record["status"]))
+    if record["requirements"]:
+        parts.append("REQUIREMENTS: " + "; ".join(record["requirements"]))
+    if record["summary"]:
+        parts.append("SUMMARY: " + " ".join(record["summary"]))
+    return "\n".join(parts)[:limit]
+
+
+def record_is_sufficient(record):
+    """
+    Enough signal to skip a Jina deep read: a closed banner, or a posting date
+    the freshness filter can actually parse plus status/type text. A date line
+    alone isn't enough ("Updated recently" matches DATE_LINE_PATTERN but has no date).
     """
-    Fetch full page text using Jina AI Reader.
+    if any(CLOSED_STATUS_PATTERN.search(s) for s in record["status"]):
+        return True
+    if not (record["posted"] and (record["status"] or record["type"])):
+        return False
+    return extract_posted_at(format_job_record(record)) is not None
+
+
+def raw_content_record(raw_content):
+    """
+    Compact record from Tavily's raw page content (scout raw mode).
+    Returns the record text, or "" if the content is missing or too thin to replace a deep read.
+    """
+    if not raw_content or len(raw_content) < RAW_CONTENT_MIN_CHARS:
+        return ""
+    record = new_job_record()
+    for line in raw_content[:DEEP_READ_MAX_CHARS].splitlines():
+        add_line_to_record(record, line)
+    return format_job_record(record) if record_is_sufficient(record) else ""
+
+
+def extract_job_signals(text, limit=DEEP_READ_RECORD_CHARS):
+    """Build the compact record from already-downloaded page text."""
+    record = new_job_record()
+    for line in text.splitlines():
+        add_line_to_record(record, line)
+    return format_job_record(record, limit)
+
+
+# ==========================================
+# DEEP-READ SELECTION (spend Jina calls where they change the decision)
+# ==========================================
+# Pages deep-read per hunt (requests may override via deep_read_budget)
+DEEP_READ_BUDGET = int(os.environ.get("DEEP_READ_BUDGET", "5"))
+DEEP_READ_MAX_BUDGET = 20
+
+# Jobs below this value aren't worth a fetch even if budget is left
+DEEP_READ_MIN_VALUE = 0.1
+
+# Snippet dates disagreeing by more than this count as conflicting cues
+DATE_CONFLICT_DAYS = 2
+
+# Dates within this share of the window from its cutoff count as "edge" (past_day: ±6h, past_week: ±1.75d)
+DATE_EDGE_SHARE = 0.25
+
+# How much a deep read could change the keep/reject decision, by snippet date evidence
+DATE_UNCERTAINTY = {
+    "conflicting": 1.0,  # Snippet dates disagree — page decides
+    "missing": 0.8,      # No date at all — page is the only source
+    "weak": 0.75,        # Only an "N ago" with no "posted" word — may not be the posting date
+    "edge": 0.7,         # Date sits near the time_filter cutoff
+    "relative": 0.4,     # Only "posted today"-style text, well inside the window (snippets lie)
+    "dated": 0.15,       # Structured/absolute date well inside the window
+    "outside": 0.05,     # Clearly older than the window — rejected either way
+}
+
+
+def deep_read_value(job, job_title, time_filter, now=None):
+    """
+    Value of information for deep-reading one job: date uncertainty x relevance.
+    Returns (value, reason).
+    """
+    from job_ranker import keyword_relevance
+
+    now = now or datetime.now(timezone.utc)
+    snippet = f"{job.get('title', '')} {job.get('body', '')}"
+    signals = date_signals(snippet, now)
+    window_days = TIME_FILTER_DAYS.get(time_filter, 7)
+    edge_days = window_days * DATE_EDGE_SHARE
+
+    if not signals:
+        reason = "missing"
+    else:
+        ages = [(now - posted_at).total_seconds() / 86400 for _, posted_at in signals]
+        if max(ages) - min(ages) > DATE_CONFLICT_DAYS:
+            reason = "conflicting"
+        elif signals[0][0] == "weak_relative":
+            reason = "weak"
+        elif abs(ages[0] - window_days) <= edge_days:
+            reason = "edge"
+        elif ages[0] > window_days:
+            reason = "outside"
+        elif signals[0][0] == "relative":
+            reason = "relative"
+        else:
+            reason = "dated"
+
+    relevance, _, _ = keyword_relevance(job_title, job.get('title', ''), job.get('body', ''))
+    value = DATE_UNCERTAINTY[reason] * (0.3 + 0.7 * relevance)
+    if job.get('is_new', True):
+        value *= 1.2  # Seen jobs were already vetted by an earlier hunt
+    return value, reason
+
+
+def select_deep_read_targets(jobs, job_title, time_filter, budget=DEEP_READ_BUDGET):
+    """Highest-value jobs to deep-read, at most `budget` of them (never below DEEP_READ_MIN_VALUE)."""
+    now = datetime.now(timezone.utc)
+    scored = []
+    for job in jobs:
+        if job.get('content_source'):
+            continue  # Page content already came with the search (or from the corpus)
+        value, reason = deep_read_value(job, job_title, time_filter, now)
+        if value >= DEEP_READ_MIN_VALUE:
+            scored.append((value, reason, job))
+    scored.sort(key=lambda s: s[0], reverse=True)
+    chosen = scored[:budget]
+    if chosen:
+        reasons = ", ".join(f"{reason} {value:.2f}" for value, reason, _ in chosen)
+        print(f"🎯 Deep-read selection: {len(chosen)}/{len(jobs)} pages (budget {budget}) — {reasons}")
+    return [job for _, _, job in chosen]
+
+
+def get_host(url):
+    """Job-board host used as the circuit-breaker key (www. stripped)."""
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+# Jina's own throttling / billing / outages say nothing about the job host
+JINA_SIDE_STATUSES = {402, 429}
+
+
+def fetch_full_job_content(url, timeout=DEEP_READ_TIMEOUT):
+    """
+    Fetch a job page using Jina AI Reader and keep only its high-signal sections.
     Jina converts messy HTML into clean, LLM-ready markdown for free.
+
+    The response is streamed line by line and dropped as soon as the record has
+    title, posted date, job type and requirements (or a "closed" banner), or after
+    DEEP_READ_MAX_CHARS. `timeout` also caps the total read time, not just each socket op.
+
+    Returns (content, host_ok) for the host's circuit breaker: True on success,
+    False for errors and non-200s from the host, None when the failure says
+    nothing about the host (Jina 402/429/5xx, or a timeout shorter than
+    DEEP_READ_HOST_ALLOWANCE). The caller records one outcome per page.
     """
+    import requests
+
+    started = time.monotonic()
     try:
         jina_url = f"https://r.jina.ai/{url}"
-        response = requests.get(jina_url, timeout=8, headers={
+        with requests.get(jina_url, timeout=timeout, stream=True, headers={
             "Accept": "text/plain"
-        })
-        if response.status_code == 200:
-            # Limit to 1500 chars to save Groq tokens (was 2000)
-            text = response.text[:1500]
-            return text
-        return ""
+        }) as response:
+            if response.status_code != 200:
+                jina_side = response.status_code in JINA_SIDE_STATUSES or response.status_code >= 500
+                return "", None if jina_side else False
+            if response.encoding is None:
+                response.encoding = "utf-8"
+
+            record = new_job_record()
+            chars_read = 0
+            for line in response.iter_lines(chunk_size=2048, decode_unicode=True):
+                if not line:
+                    continue
+                chars_read += len(line)
+                add_line_to_record(record, line)
+                if record_has_enough(record) or chars_read >= DEEP_READ_MAX_CHARS:
+                    break
+                if time.monotonic() - started >= timeout:
+                    print(f"  ⏱️ Deep read cut at {chars_read} chars: {url[:40]}...")
+                    break
+
+        return format_job_record(record), True
+    except requests.exceptions.Timeout as e:
+        print(f"  ⚠️ Deep read timed out for {url[:40]}...: {e}")
+        # The host had its fair allowance; a shorter timeout is just our deadline running out
+        return "", False if timeout >= DEEP_READ_HOST_ALLOWANCE else None
     except Exception as e:
         print(f"  ⚠️ Deep read failed for {url[:40]}...: {e}")
-        return ""
+        return "", False
 
 
-def deep_read_jobs(jobs, max_jobs=20):
+def deep_read_jobs(jobs, max_jobs=20, deadline=None, degraded=None, job_title=None, time_filter="past_week"):
     """
-    CRITICAL: Deep read ALL jobs to get full page content with REAL dates.
+    CRITICAL: Deep read jobs to get full page content with REAL dates.
     Tavily snippets often say "Posted today" but actual page shows old dates.
-    Increased max_jobs to ensure we validate ALL job dates properly.
+
+    With `job_title`, the max_jobs pages are chosen by select_deep_read_targets
+    (missing/conflicting/borderline dates on relevant jobs first); otherwise the
+    first max_jobs jobs are read. Unread jobs keep their snippet.
+
+    LATENCY BUDGET:
+    - Deep reads must finish ANALYSIS_RESERVE_SECONDS before `deadline` so Groq keeps its share.
+    - Pages still outstanding at that point are abandoned and fall back to the Tavily snippet.
+    - A page slower than DEEP_READ_HEDGE_AFTER gets one hedged duplicate fetch (first answer wins).
+    - Hosts with an open circuit breaker are skipped and use the snippet straight away.
     """
-    print(f"📖 Deep reading ALL {min(len(jobs), max_jobs)} job pages for date validation...")
+    if job_title:
+        targets = select_deep_read_targets(jobs, job_title, time_filter, budget=max_jobs)
+    else:
+        targets = jobs[:max_jobs]
+    targets = [job for job in targets if not job.get('content_source')]
+    print(f"📖 Deep reading {len(targets)} job pages for date validation...")
+
+    read_deadline = None if deadline is None else deadline - ANALYSIS_RESERVE_SECONDS
+    started = {}   # job index -> when its first fetch actually began
+    results = {}   # job index -> page text ("" = failed)
+    host_ok = {}   # job index -> breaker outcome over all of its fetches (hedges included)
+
+    def timed_fetch(idx):
+        started.setdefault(idx, time.monotonic())
+        remaining = time_left(read_deadline)
+        page_timeout = DEEP_READ_TIMEOUT if remaining is None else max(0.5, min(DEEP_READ_TIMEOUT, remaining))
+        return fetch_full_job_content(targets[idx]['href'], timeout=page_timeout)
 
-    def read_single(job):
-        content = fetch_full_job_content(job['href'])
+    # Circuit breaker: known-bad hosts go straight to the snippet
+    readable = []
+    for idx, job in enumerate(targets):
+        if allow_deep_read(get_host(job['href'])):
+            readable.append(idx)
+        else:
+            results[idx] = ""
+            print(f"  ⛔ Skipping deep read (host circuit open): {get_host(job['href'])}")
+
+    # Read pages in parallel (3 at a time to respect rate limits, +1 slot for hedges)
+    executor = ThreadPoolExecutor(max_workers=4)
+    futures = {executor.submit(timed_fetch, idx): idx for idx in readable}
+    pending = set(futures)
+    hedged = set()
+
+    while pending:
+        remaining = time_left(read_deadline)
+        if remaining is not None and remaining <= 0:
+            break
+        poll = DEEP_READ_HEDGE_AFTER / 2 if remaining is None else min(remaining, DEEP_READ_HEDGE_AFTER / 2)
+        done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            idx = futures[future]
+            if idx in results:
+                continue  # A hedge for this page already won
+            try:
+                content, ok = future.result()
+            except Exception as e:
+                print(f"  ⚠️ Deep read error: {e}")
+                content, ok = "", None
+            if ok is not None:
+                host_ok[idx] = host_ok.get(idx, False) or ok
+            # An empty result only counts if no other fetch for this page is still in flight
+            if content or not any(futures[f] == idx for f in pending):
+                results[idx] = content
+
+        # Drop losing duplicates, then hedge stragglers
+        pending = {f for f in pending if futures[f] not in results}
+        now = time.monotonic()
+        for future in list(pending):
+            idx = futures[future]
+            if idx in hedged or len(hedged) >= DEEP_READ_MAX_HEDGES:
+                continue
+            if idx in started and now - started[idx] >= DEEP_READ_HEDGE_AFTER:
+                hedged.add(idx)
+                print(f"  🔁 Hedging slow deep read: {targets[idx]['title'][:40]}...")
+                hedge = executor.submit(timed_fetch, idx)
+                futures[hedge] = idx
+                pending.add(hedge)
+
+    # Don't wait for stragglers — their requests time out on their own
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    # Still unanswered at the read deadline after a fair allowance → the host is slow
+    now = time.monotonic()
+    for idx in readable:
+        if idx not in results and idx in started and now - started[idx] >= DEEP_READ_HOST_ALLOWANCE:
+            host_ok[idx] = host_ok.get(idx, False)
+
+    # One breaker outcome per page, however many fetches (original + hedge) it took
+    for idx, ok in host_ok.items():
+        record_deep_read_result(get_host(targets[idx]['href']), success=ok)
+
+    timed_out = 0
+    for idx, job in enumerate(targets):
+        content = results.get(idx, "")
+        if idx not in results:
+            timed_out += 1
         if content:
             job['full_content'] = content
+            job['content_source'] = "jina"
             print(f"  ✅ Deep read: {job['title'][:40]}...")
         else:
             job['full_content'] = job.get('body', '')
-        return job
 
-    # Read pages in parallel (3 at a time to respect rate limits)
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {executor.submit(read_single, job): job for job in jobs[:max_jobs]}
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                print(f"  ⚠️ Deep read error: {e}")
+    if timed_out:
+        print(f"  ⏱️ Deadline hit: {timed_out} deep read(s) fell back to the Tavily snippet")
+        _mark_degraded(degraded, "deep_read")
 
-    # Jobs beyond max_jobs keep their original snippet
-    for job in jobs[max_jobs:]:
-        job['full_content'] = job.get('body', '')
+    # Jobs not selected keep their original snippet (or page content they already had)
+    target_ids = {id(job) for job in targets}
+    for job in jobs:
+        if id(job) not in target_ids and not job.get('content_source'):
+            job['full_content'] = job.get('body', '')
 
     return jobs
 
@@ -305,11 +771,13 @@ def deep_read_jobs(jobs, max_jobs=20):
 # ==========================================
 # SCOUT (Tavily - Never Blocked on Render)
 # ==========================================
-def scout_for_jobs(job_title, location, time_filter="past_week", job_type="any"):
+def scout_for_jobs(job_title, location, time_filter="past_week", job_type="any", deadline=None, degraded=None):
     """
     Tavily search with job type filtering.
     Never blocked on Render, works 100% of the time.
+    With a `deadline`, the search may only use the time not reserved for Groq.
     """
+    tavily_client = get_tavily_client()
     if not tavily_client:
         return []
     
@@ -336,6 +804,10 @@ def scout_for_jobs(job_title, location, time_filter="past_week", job_type="any")
     
     # Construct the search query
     query = f"{job_title} {type_kw} in {location}"
+
+    # Tavily's own default timeout is 60s — cap it at our share of the budget
+    remaining = time_left(deadline)
+    search_timeout = 60 if remaining is None else max(1.0, remaining - ANALYSIS_RESERVE_SECONDS)
     
     try:
         # Tavily searches and reads the content in one go
@@ -345,16 +817,24 @@ def scout_for_jobs(job_title, location, time_filter="past_week", job_type="any")
             search_depth="basic",
             max_results=25,
             days=days_limit,  # CRITICAL: Only return results from last N days
+            include_raw_content="markdown" if SCOUT_RAW_CONTENT else False,
+            timeout=search_timeout,
         )
         
         # Normalize data for Groq
         normalized_jobs = []
+        raw_hits = 0
         for result in response.get('results', []):
             job = {
                 "title": result.get('title', ''),
                 "href": result.get('url', ''),
                 "body": result.get('content', '')  # Tavily gives us the text content directly!
             }
+            # Raw mode: a page with date + status/type signals needs no Jina deep read
+            record = raw_content_record(result.get('raw_content'))
+            if record:
+                job['full_content'] = record
+                job['content_source'] = "tavily_raw"
             
             # Pre-filter: stale results AND search/aggregator pages
             is_stale = is_likely_stale(job, time_filter)  # Pass time_filter for strict checking
@@ -362,6 +842,7 @@ def scout_for_jobs(job_title, location, time_filter="past_week", job_type="any")
             
             if not is_stale and not is_search:
                 normalized_jobs.append(job)
+                raw_hits += 'content_source' in job
             else:
                 # Log why it was filtered
                 if is_stale and is_search:
@@ -373,36 +854,149 @@ def scout_for_jobs(job_title, location, time_filter="past_week", job_type="any")
                 print(f"  🗑️  Filtered ({reason}): {job['title'][:50]}...")
         
         print(f"✅ Found {len(normalized_jobs)} direct job postings after filtering.")
+        if SCOUT_RAW_CONTENT:
+            print(f"📄 Tavily raw content sufficient for {raw_hits}/{len(normalized_jobs)} (no Jina needed)")
         return normalized_jobs[:20]
     
     except Exception as e:
         print(f"❌ Scout Error: {e}")
+        if deadline is not None and time_left(deadline) <= ANALYSIS_RESERVE_SECONDS:
+            _mark_degraded(degraded, "scout")
         return []
 
 
 # ==========================================
 # THE BRAIN — God-Tier Prompting + Resume Matching
 # ==========================================
-def analyze_jobs_with_groq(job_list, job_title, location, api_keys, time_filter="past_week", resume_text="", job_type="any"):
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# Batch hunts: how many compatible hunts may share one Groq call, and the job cap per call
+MAX_HUNTS_PER_LLM_CALL = 3
+MAX_JOBS_PER_LLM_CALL = 30
+
+# Marker line that separates per-hunt sections in a batch response
+BATCH_SECTION_PATTERN = re.compile(r'^[#\s]*=+\s*HUNT\s*\[(\d+)\]\s*=+\s*$', re.MULTILINE)
+
+# ==========================================
+# GROQ QUOTA FORECAST (org-wide daily token budget, shared by all 3 keys)
+# ==========================================
+GROQ_DAILY_TOKEN_LIMIT = int(os.environ.get("GROQ_DAILY_TOKEN_LIMIT", "100000"))
+
+# Typical completion size for a 5-job report (added to the prompt estimate)
+GROQ_COMPLETION_TOKENS_ESTIMATE = 900
+
+# How long Groq's own "Limit N, Used M" numbers are trusted if no retry time is given
+GROQ_SNAPSHOT_TTL_SECONDS = 3600
+
+RATE_LIMIT_USAGE_PATTERN = re.compile(r'Limit\s+(\d+),\s*Used\s+(\d+)', re.IGNORECASE)
+RETRY_AFTER_PATTERN = re.compile(r'try again in\s+(?:(\d+)h)?(?:(\d+)m)?(?:([\d.]+)s)?', re.IGNORECASE)
+
+
+def get_groq_tokens_remaining():
     """
-    UPGRADE 2: Now includes Resume Matchmaker for Fit Score + Gap analysis.
-    Uses deep-read content when available.
-    
-    UPGRADE 3: 3-KEY SEQUENTIAL FAILOVER SYSTEM
-    - Tries PRIMARY key first
-    - If rate limit (429), tries BACKUP key
-    - If still rate limit, tries TERTIARY key
-    - Only fails if all 3 keys exhausted
-    
-    Args:
-        api_keys: Dict with 'primary', 'backup', 'tertiary' keys
+    Predicted tokens left today: our own 24h usage log, tightened by the last
+    numbers Groq reported in a 429 (until its retry time passes).
     """
-    if not job_list:
-        return "No jobs found to analyze."
+    now = time.time()
+    remaining = GROQ_DAILY_TOKEN_LIMIT - get_groq_usage_since(now - 86400)
+    snapshot = get_groq_quota_snapshot()
+    if snapshot and now < snapshot["retry_at"]:
+        reported = snapshot["token_limit"] - snapshot["tokens_used"] - get_groq_usage_since(snapshot["observed_at"])
+        remaining = min(remaining, reported)
+    return max(0, remaining)
 
-    print("⚡ Groq Forensic Analysis starting...")
-    
-    # Prepare list of keys to try (in order)
+
+# Load shedding: burn rate over this window decides how long today's budget lasts
+QUOTA_BURN_WINDOW_SECONDS = 900
+
+# Service modes — switch to a cheaper mode when the runway at the current burn
+# rate, or the share of the daily budget left, drops below these
+ECONOMY_RUNWAY_HOURS = float(os.environ.get("QUOTA_ECONOMY_RUNWAY_HOURS", "6"))
+MINIMAL_RUNWAY_HOURS = float(os.environ.get("QUOTA_MINIMAL_RUNWAY_HOURS", "2"))
+ECONOMY_REMAINING_SHARE = 0.25
+MINIMAL_REMAINING_SHARE = 0.10
+
+# What each mode changes (None = keep the request's own setting)
+SERVICE_MODES = {
+    "normal": {"deep_read_budget": None, "prompt_variant": None},
+    "economy": {"deep_read_budget": 2, "prompt_variant": "compact"},
+    "minimal": {"deep_read_budget": 0, "prompt_variant": "compact"},
+}
+
+
+def forecast_groq_quota():
+    """
+    Tokens left, current burn rate and the service mode it calls for.
+    Deep reads cost tokens too (page records are longer than snippets), so
+    cheaper modes trim them before the budget runs out.
+    """
+    remaining = get_groq_tokens_remaining()
+    burned = get_groq_usage_since(time.time() - QUOTA_BURN_WINDOW_SECONDS)
+    burn_per_hour = burned * 3600 / QUOTA_BURN_WINDOW_SECONDS
+    runway_hours = remaining / burn_per_hour if burn_per_hour else None
+    share = remaining / GROQ_DAILY_TOKEN_LIMIT if GROQ_DAILY_TOKEN_LIMIT else 0.0
+
+    def below(runway_limit, share_limit):
+        return share < share_limit or (runway_hours is not None and runway_hours < runway_limit)
+
+    if below(MINIMAL_RUNWAY_HOURS, MINIMAL_REMAINING_SHARE):
+        mode = "minimal"
+    elif below(ECONOMY_RUNWAY_HOURS, ECONOMY_REMAINING_SHARE):
+        mode = "economy"
+    else:
+        mode = "normal"
+    return {
+        "mode": mode,
+        "tokens_remaining": remaining,
+        "burn_per_hour": round(burn_per_hour),
+        "runway_hours": None if runway_hours is None else round(runway_hours, 1),
+    }
+
+
+def note_rate_limit_error(error_str):
+    """Store Groq's "Limit 100000, Used 99551" numbers from a 429 so we stop paying failing round trips."""
+    usage = RATE_LIMIT_USAGE_PATTERN.search(error_str)
+    if not usage:
+        return
+    retry_seconds = GROQ_SNAPSHOT_TTL_SECONDS
+    retry = RETRY_AFTER_PATTERN.search(error_str)
+    if retry and any(retry.groups()):
+        hours, minutes, seconds = retry.groups()
+        retry_seconds = int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
+    save_groq_quota_snapshot(int(usage.group(1)), int(usage.group(2)), time.time() + retry_seconds)
+
+
+def local_analysis(job_list, job_title, location, time_filter, resume_text, job_type, reason):
+    """Zero-LLM fallback report (see job_ranker)."""
+    from job_ranker import rank_jobs_locally
+
+    print(f"⚡ Local ranking instead of Groq: {reason}")
+    return rank_jobs_locally(job_list, job_title, location, time_filter=time_filter,
+                             resume_text=resume_text, job_type=job_type, reason=reason)
+
+
+def fallback_reason(analysis):
+    """Short user-facing reason for a failed Groq analysis."""
+    if analysis.startswith("⏱️"):
+        return "Hunt deadline reached before AI analysis could run"
+    if analysis.startswith("❌ No API keys"):
+        return "No Groq API keys configured"
+    if analysis.startswith("❌ All "):
+        return "All Groq API keys are rate limited"
+    return "AI analysis failed"
+
+
+def quota_shortfall(system_prompt, user_prompt):
+    """None if today's predicted Groq budget covers this prompt, else a reason string."""
+    needed = estimate_tokens(system_prompt) + estimate_tokens(user_prompt) + GROQ_COMPLETION_TOKENS_ESTIMATE
+    remaining = get_groq_tokens_remaining()
+    if remaining >= needed:
+        return None
+    return f"Groq daily token budget predicted exhausted ({remaining:,} left, ~{needed:,} needed)"
+
+
+def get_keys_to_try(api_keys):
+    """Prepare list of keys to try (in order)."""
     keys_to_try = []
     if api_keys.get("primary"):
         keys_to_try.append(("PRIMARY", api_keys["primary"]))
@@ -410,185 +1004,75 @@ def analyze_jobs_with_groq(job_list, job_title, location, api_keys, time_filter=
         keys_to_try.append(("BACKUP", api_keys["backup"]))
     if api_keys.get("tertiary"):
         keys_to_try.append(("TERTIARY", api_keys["tertiary"]))
-    
+    return keys_to_try
+
+
+def complete_with_key_failover(system_prompt, user_prompt, api_keys, deadline=None, degraded=None):
+    """
+    UPGRADE 3: 3-KEY SEQUENTIAL FAILOVER SYSTEM
+    - Tries PRIMARY key first
+    - If rate limit (429), tries BACKUP key
+    - If still rate limit, tries TERTIARY key
+    - Only fails if all 3 keys exhausted
+
+    Returns the model's markdown, or a user-facing "❌ ..." / "⏱️ ..." message.
+    """
+    keys_to_try = get_keys_to_try(api_keys)
     if not keys_to_try:
         return "❌ No API keys configured. Please add API keys to .env file."
-    
+
     print(f"🔑 {len(keys_to_try)} API key(s) available for failover")
 
     # Define the core analysis function
     def execute_analysis(current_api_key, key_name):
-        print(f"🤖 Agent activated using {key_name} key...")
-        client = Groq(api_key=current_api_key)
-        
-        # --- 1. Prepare Evidence ---
-    def execute_analysis(current_api_key, key_name):
-        print(f"🤖 Agent activated using {key_name} key...")
-        client = Groq(api_key=current_api_key)
-        
-        # --- 1. Prepare Evidence ---
-        job_text = ""
-        for i, job in enumerate(job_list):
-            full_content = job.get('full_content', job.get('body', ''))
-            job_text += f"""
-            [JOB MATCH #{i+1}]
-            - URL: {job['href']}
-            - TITLE: {job['title']}
-            - CONTENT: {full_content[:2500]}
-            - NEW: {"YES ✨" if job.get('is_new', True) else "PREVIOUSLY SEEN"}
-            """
-
-        # --- 2. The Persona ---
-        freshness_persona = {
-            "past_day": "If a job looks older than 24 HOURS, discard it immediately.",
-            "past_week": "If a job looks older than 7 DAYS, discard it immediately.",
-            "past_month": "If a job looks older than 30 DAYS, discard it immediately.",
-        }
-
-        # Job type filter instruction
-        job_type_labels = {
-            "internship": "ONLY include INTERNSHIP positions. Reject full-time, contract, or senior roles.",
-            "fulltime": "ONLY include FULL-TIME positions. Reject internships, part-time, or contract roles.",
-            "parttime": "ONLY include PART-TIME positions. Reject full-time or internship roles.",
-            "contract": "ONLY include CONTRACT positions. Reject permanent or internship roles.",
-            "freelance": "ONLY include FREELANCE or REMOTE CONTRACT positions.",
-            "any": "Include any job type (internship, full-time, contract, etc.).",
-        }
-        job_type_instruction = job_type_labels.get(job_type, job_type_labels["any"])
-
-        system_prompt = f"""
-        You are an Elite Technical Recruiter and Forensic Job Analyst.
-        Your standard is perfection. You DO NOT tolerate old, stale, or irrelevant results.
-
-        ⚠️ CRITICAL DATE VALIDATION RULES ⚠️
-        The job listings you receive may contain MISLEADING date information in snippets.
-        You MUST validate dates using the FULL CONTENT field.
-        
-        DATE VALIDATION PROTOCOL:
-        1. Check the FULL CONTENT for date indicators: "years ago", "months ago", "weeks ago", "days ago"
-        2. If you see "2 years ago", "6 months ago", "3 weeks ago" in content → REJECT IMMEDIATELY
-        3. If no clear recent date is visible → ASSUME IT'S OLD and REJECT
-        4. ONLY accept jobs that explicitly show: "today", "yesterday", "1 day ago", "2 days ago" for past_day filter
-        5. For past_week: ONLY accept "today", "yesterday", "X days ago" where X ≤ 7
-        6. If a job page shows date indicators like "2yr", "6yr", "months" → IMMEDIATE REJECTION
-
-        Your Prime Directives:
-        1. FILTER RUTHLESSLY: {freshness_persona.get(time_filter, freshness_persona["past_week"])}
-        2. DATE VALIDATION: Check FULL CONTENT for actual dates. Snippets LIE. Trust only full page content.
-        3. JOB TYPE FILTER: {job_type_instruction}
-        4. DETECT SEO SPAM: Articles, LinkedIn profiles (not job posts), forums, tutorials — BURN THEM.
-        5. PRIORITIZE "NEW" JOBS: Jobs marked "NEW ✨" should rank higher.
-        6. CHECK FOR "CLOSED": If content says "closed", "expired", "position filled" — REJECT.
-        7. NO DATE VISIBLE = OLD JOB: If you can't clearly see a recent date, REJECT IT.
-        8. NEVER INVENT: If fewer than 3 good jobs exist, stop early. Do NOT hallucinate.
-        """
-
-        # --- 3. Resume matching section ---
-        resume_section = ""
-        if resume_text and resume_text.strip():
-            resume_section = f"""
-
-        📋 CANDIDATE RESUME:
-        {resume_text[:2000]}
-
-        ADDITIONAL TASK — RESUME MATCHING:
-        For each job, compare the requirements against the candidate's resume and provide:
-        - **Fit Score (0-100%)**: How well the candidate matches
-        - **✅ Matches**: Skills/experience the candidate HAS that the job requires
-        - **⚠️ Gaps**: Skills the job requires but the candidate LACKS
-        """
-
-        # Job type display
-        type_display = f" ({job_type.upper()})" if job_type != "any" else ""
-        
-        # LAYER 2: Inject TODAY'S DATE for mathematical validation
-        today_str = datetime.date.today().strftime("%B %d, %Y")  # e.g., "February 11, 2026"
+        from groq import Groq
 
-        # --- 4. The Mission ---
-        user_prompt = f"""
-        🗓️ TODAY'S DATE is: {today_str}
-        
-        MISSION: Find the top 5 ACTIVE{type_display} job openings for '{job_title}' in '{location}'.
-        TIME FILTER: {time_filter}
-
-        Here is the raw data stream from the web:
-        {job_text}
-
-        ⚠️ CRITICAL: Each job's CONTENT field contains the FULL PAGE TEXT.
-        The snippet may say "Posted today" but the full content shows the REAL date.
-        You MUST read the FULL CONTENT carefully for date indicators.
-        
-        ⚠️ MATHEMATICAL DATE VALIDATION:
-
-        --------------------------------------------------
-        YOUR ANALYSIS PROCESS (Mental Scratchpad):
-        For EACH job match:
-        0. FIRST: Scan the CONTENT for date indicators ("years ago", "yr", "months ago", etc.)
-        1. Does CONTENT show "years ago", "yr", "6 months ago", "2 weeks ago"? → REJECT IMMEDIATELY.
-        2. Does the content say "closed", "expired", "filled"? → REJECT.
-        3. Is the title a person's name/profile (not a job)? → REJECT.
-        4. Is the URL a blog, tutorial, or forum? → REJECT.
-        5. Is it from a job board or company careers page? → Check date anyway.
-        6. Does it mention tech stacks, "hiring", "apply now", salary? → Good sign, but CHECK DATE FIRST.
-        7. Does the job type match "{job_type}"? → If not, REJECT.
-        8. Can you see a clear, recent date matching {time_filter}? → If NO, REJECT.
-        --------------------------------------------------
-        {resume_section}
-
-        FINAL OUTPUT FORMAT:
-
-        ### 🏆 TOP JOB MATCH [1]
-        **Job Title:** [Exact Title]
-        **Company:** [Company Name]
-        **Type:** [Internship / Full-Time / Contract / etc.]
-        **Location:** [Where]
-        **Freshness:** [e.g. "Posted today", "2 days ago"]
-        {{
-        '**Fit Score:** [0-100%]' if resume_text else ''
-        }}
-        **Why it matches:** [1 sentence]
-        {{
-        '**✅ Matches:** [Skills you have that match]' if resume_text else ''
-        }}
-        {{
-        '**⚠️ Gaps:** [Skills required but missing from resume]' if resume_text else ''
-        }}
-        **Direct Link:** [Full URL]
-
-        (Repeat for Top 2-5. Stop early if fewer exist. DO NOT INVENT JOBS.)
-
-        If ZERO real job postings pass your filters, say:
-        "❌ No fresh, legitimate job postings found. Try 'Past Month' filter or search directly on LinkedIn/Indeed."
-        """
+        print(f"🤖 Agent activated using {key_name} key...")
+        remaining = time_left(deadline)
+        if remaining is None:
+            client = Groq(api_key=current_api_key)
+        else:
+            # No SDK retries under a deadline — a retry would blow the budget
+            client = Groq(api_key=current_api_key, timeout=remaining, max_retries=0)
 
         chat_completion = client.chat.completions.create(
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            model="llama-3.3-70b-versatile",
+            model=GROQ_MODEL,
             temperature=0,  # ZERO creativity - strict logical filtering only!
         )
+        usage = getattr(chat_completion, "usage", None)
+        if usage is not None:
+            record_groq_usage(usage.total_tokens, key_name)
         return chat_completion.choices[0].message.content
 
     # --- 3-KEY SEQUENTIAL FAILOVER LOGIC ---
     last_error = None
-    
+
     for i, (key_name, api_key) in enumerate(keys_to_try):
+        remaining = time_left(deadline)
+        if remaining is not None and remaining < ANALYSIS_MIN_SECONDS:
+            print(f"⏱️ Deadline reached before {key_name} key could run — skipping analysis")
+            _mark_degraded(degraded, "analysis")
+            return "⏱️ Hunt deadline reached before AI analysis could finish. Raw results are listed below — try again for a full report."
+
         try:
             print(f"🔑 Trying {key_name} key ({i+1}/{len(keys_to_try)})...")
             result = execute_analysis(api_key, key_name)
             print(f"✅ {key_name} key succeeded!")
             return result
-            
+
         except Exception as e:
             error_str = str(e)
             last_error = error_str
-            
+
             # Check for Rate Limit (429)
             if "429" in error_str or "rate_limit" in error_str.lower() or "rate limit" in error_str.lower():
                 print(f"⚠️  {key_name} key hit RATE LIMIT!")
-                
+                note_rate_limit_error(error_str)
+
                 # If there are more keys to try, continue
                 if i < len(keys_to_try) - 1:
                     next_key_name = keys_to_try[i+1][0]
@@ -601,13 +1085,225 @@ def analyze_jobs_with_groq(job_list, job_title, location, api_keys, time_filter=
             else:
                 # Non-rate-limit error
                 print(f"❌ {key_name} key failed with error: {error_str[:100]}")
-                
+
                 # Try next key for non-rate-limit errors too
                 if i < len(keys_to_try) - 1:
                     print(f"🔄 Trying next key...")
                     continue
                 else:
                     return f"❌ Analysis Error (all keys tried): {error_str}"
-    
+
     # Fallback (should never reach here)
     return f"❌ Unexpected error: {last_error}"
+
+
+def analyze_jobs_with_groq(job_list, job_title, location, api_keys, time_filter="past_week", resume_text="", job_type="any", deadline=None, degraded=None, prompt_variant=None):
+    """
+    UPGRADE 2: Now includes Resume Matchmaker for Fit Score + Gap analysis.
+    Uses deep-read content when available.
+    Key failover lives in complete_with_key_failover().
+
+    Args:
+        api_keys: Dict with 'primary', 'backup', 'tertiary' keys
+        deadline: Optional monotonic deadline — each Groq call gets whatever time remains
+        prompt_variant: "full" or "compact" (defaults to PROMPT_VARIANT)
+    """
+    analysis, _ = _analyze_single_hunt(job_list, job_title, location, api_keys, time_filter, resume_text,
+                                       job_type, deadline, degraded, prompt_variant)
+    return analysis
+
+
+def _analyze_single_hunt(job_list, job_title, location, api_keys, time_filter, resume_text, job_type, deadline, degraded, prompt_variant):
+    """analyze_jobs_with_groq() plus whether Groq was actually called (False when the local fallback ran up front)."""
+    if not job_list:
+        return "No jobs found to analyze.", False
+
+    variant = prompt_variant or PROMPT_VARIANT
+    print(f"⚡ Groq Forensic Analysis starting ({variant} prompt)...")
+
+    # Static prefix is compiled once per combination; only the user message varies
+    system_prompt = get_system_prompt(time_filter, job_type, bool(resume_text and resume_text.strip()), variant)
+    user_prompt = build_user_prompt(job_list, job_title, location, time_filter, resume_text, job_type, variant)
+
+    # Don't spend a failing round trip per key when the org quota can't cover this prompt
+    shortfall = quota_shortfall(system_prompt, user_prompt)
+    if shortfall:
+        _mark_degraded(degraded, "analysis")
+        return local_analysis(job_list, job_title, location, time_filter, resume_text, job_type, shortfall), False
+
+    analysis = complete_with_key_failover(system_prompt, user_prompt, api_keys, deadline=deadline, degraded=degraded)
+    if is_analysis_error(analysis):
+        _mark_degraded(degraded, "analysis")
+        return local_analysis(job_list, job_title, location, time_filter, resume_text, job_type, fallback_reason(analysis)), True
+    return analysis, True
+
+
+def is_analysis_error(analysis):
+    """True for the user-facing failure messages (no report to split or cache)."""
+    return analysis.startswith(("❌ No API keys", "❌ All ", "❌ Analysis Error", "❌ Unexpected error", "⏱️"))
+
+
+def split_batch_analysis(analysis, hunt_count):
+    """Split a batch response on its ===== HUNT [k] ===== markers. Missing sections come back as None."""
+    sections = [None] * hunt_count
+    markers = list(BATCH_SECTION_PATTERN.finditer(analysis))
+    for n, marker in enumerate(markers):
+        k = int(marker.group(1))
+        end = markers[n + 1].start() if n + 1 < len(markers) else len(analysis)
+        if 1 <= k <= hunt_count and sections[k - 1] is None:
+            sections[k - 1] = analysis[marker.end():end].strip()
+    return sections
+
+
+# ==========================================
+# DELTA MERGE (re-hunts only analyze what's new)
+# ==========================================
+MATCH_SECTION_PATTERN = re.compile(r'^#+\s*🏆\s*TOP JOB MATCH\s*\[\d+\]', re.MULTILINE)
+DIRECT_LINK_PATTERN = re.compile(r'\*\*Direct Link:\*\*\s*(\S+)')
+MAX_MERGED_MATCHES = 5
+
+
+def split_match_sections(analysis):
+    """(preamble, [match sections]) for a markdown report."""
+    markers = list(MATCH_SECTION_PATTERN.finditer(analysis))
+    if not markers:
+        return analysis.strip(), []
+    preamble = analysis[:markers[0].start()].strip()
+    sections = []
+    for n, marker in enumerate(markers):
+        end = markers[n + 1].start() if n + 1 < len(markers) else len(analysis)
+        sections.append(analysis[marker.end():end].strip())
+    return preamble, sections
+
+
+def merge_analyses(new_analysis, previous_analysis, max_matches=MAX_MERGED_MATCHES):
+    """
+    Merge the report for newly found jobs into the previous report.
+    New matches go first, duplicates (same Direct Link) are dropped and the
+    result is renumbered and capped at max_matches.
+    """
+    new_preamble, new_sections = split_match_sections(new_analysis)
+    old_preamble, old_sections = split_match_sections(previous_analysis)
+    if not new_sections:
+        return previous_analysis
+    if not old_sections:
+        return new_analysis
+
+    merged, links = [], set()
+    for section in new_sections + old_sections:
+        link = DIRECT_LINK_PATTERN.search(section)
+        if link:
+            if link.group(1) in links:
+                continue
+            links.add(link.group(1))
+        merged.append(section)
+
+    return _join_match_sections(new_preamble or old_preamble, merged[:max_matches])
+
+
+def drop_match_sections(analysis, urls):
+    """Remove the match sections whose Direct Link is in `urls` and renumber the rest."""
+    preamble, sections = split_match_sections(analysis)
+    kept = []
+    for section in sections:
+        link = DIRECT_LINK_PATTERN.search(section)
+        if not (link and link.group(1) in urls):
+            kept.append(section)
+    if len(kept) == len(sections):
+        return analysis
+    return _join_match_sections(preamble, kept)
+
+
+def _join_match_sections(preamble, sections):
+    body = "\n\n".join(
+        f"### 🏆 TOP JOB MATCH [{rank}]\n{section}"
+        for rank, section in enumerate(sections, start=1)
+    )
+    if not body:
+        return preamble
+    return f"{preamble}\n\n{body}" if preamble else body
+
+
+def analyze_job_batch_with_groq(hunts, api_keys, time_filter="past_week", resume_text="", job_type="any", deadline=None, degraded=None, prompt_variant=None):
+    """
+    BATCH BRAIN: analyze several compatible hunts (same time_filter + job_type) together.
+
+    Args:
+        hunts: List of {"job_title", "location", "jobs"} dicts
+    Returns:
+        (analyses, llm_calls) — one markdown report per hunt, in order, and how many
+        Groq calls it took. Hunts are packed MAX_HUNTS_PER_LLM_CALL at a time (fewer
+        if their shared job pool would exceed MAX_JOBS_PER_LLM_CALL); a hunt whose
+        section is missing from the batch answer gets its own single-hunt call.
+        If Groq can't be used, hunts get the local ranker's report instead.
+    """
+    analyses = [None] * len(hunts)
+    llm_calls = 0
+    variant = prompt_variant or PROMPT_VARIANT
+    system_prompt = get_system_prompt(time_filter, job_type, bool(resume_text and resume_text.strip()), variant)
+
+    # Pack hunts into calls
+    packs = []
+    current, current_urls = [], set()
+    for idx, hunt in enumerate(hunts):
+        if not hunt['jobs']:
+            analyses[idx] = "No jobs found to analyze."
+            continue
+        urls = {job['href'] for job in hunt['jobs']}
+        if current and (len(current) >= MAX_HUNTS_PER_LLM_CALL or len(current_urls | urls) > MAX_JOBS_PER_LLM_CALL):
+            packs.append(current)
+            current, current_urls = [], set()
+        current.append(idx)
+        current_urls |= urls
+    if current:
+        packs.append(current)
+
+    for pack in packs:
+        if len(pack) == 1:
+            idx = pack[0]
+            analyses[idx], called = _analyze_single_hunt(
+                hunts[idx]['jobs'], hunts[idx]['job_title'], hunts[idx]['location'], api_keys,
+                time_filter, resume_text, job_type, deadline, degraded, variant,
+            )
+            llm_calls += called
+            continue
+
+        # Shared pool: each URL listed once
+        job_pool, pool_urls = [], set()
+        for idx in pack:
+            for job in hunts[idx]['jobs']:
+                if job['href'] not in pool_urls:
+                    pool_urls.add(job['href'])
+                    job_pool.append(job)
+
+        print(f"⚡ Groq batch analysis: {len(pack)} hunts, {len(job_pool)} unique jobs in one call...")
+        pack_hunts = [hunts[idx] for idx in pack]
+        user_prompt = build_batch_user_prompt(pack_hunts, job_pool, time_filter, resume_text, job_type, variant)
+
+        reason = quota_shortfall(system_prompt, user_prompt)
+        if not reason:
+            analysis = complete_with_key_failover(system_prompt, user_prompt, api_keys, deadline=deadline, degraded=degraded)
+            llm_calls += 1
+            if is_analysis_error(analysis):
+                reason = fallback_reason(analysis)
+
+        if reason:
+            _mark_degraded(degraded, "analysis")
+            for idx in pack:
+                analyses[idx] = local_analysis(
+                    hunts[idx]['jobs'], hunts[idx]['job_title'], hunts[idx]['location'],
+                    time_filter, resume_text, job_type, reason,
+                )
+            continue
+
+        for idx, section in zip(pack, split_batch_analysis(analysis, len(pack))):
+            if section is None:
+                print(f"  ⚠️ Batch answer had no section for '{hunts[idx]['job_title']}' — analyzing it alone")
+                section, called = _analyze_single_hunt(
+                    hunts[idx]['jobs'], hunts[idx]['job_title'], hunts[idx]['location'], api_keys,
+                    time_filter, resume_text, job_type, deadline, degraded, variant,
+                )
+                llm_calls += called
+            analyses[idx] = section
+
+    return analyses, llm_calls
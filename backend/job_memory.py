@@ -3,17 +3,54 @@ SQLite "Brain Implant" — Long-Term Memory for Digital Headhunter
 
 Stores seen job URLs so the agent doesn't show you the same job twice.
 Creates a tiny `jobs.db` file in the backend directory.
+
+Also keeps a local job corpus (title, snippet, deep-read content, posting date)
+indexed with FTS5, so hunts can start from jobs we've already scouted.
 """
 
 import sqlite3
 import os
+import re
+import json
+import threading
+import time
 from datetime import datetime
 
-DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jobs.db')
+DB_PATH = os.environ.get("JOBS_DB_PATH") or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jobs.db')
+
+# Tables are created on first use (not at import) to keep cold start fast
+_db_ready = False
+_db_lock = threading.Lock()
+
+# Deep-read circuit breaker (per job-board host, shared by all workers via SQLite)
+BREAKER_FAILURE_THRESHOLD = 3      # Consecutive failures/timeouts before a host is skipped
+BREAKER_COOLDOWN_SECONDS = 600     # How long an open breaker skips the host
+BREAKER_PROBE_TIMEOUT_SECONDS = 30  # A half-open probe older than this is considered lost
+
+# Groq usage rows older than this are pruned (the daily quota only needs the last 24h)
+GROQ_USAGE_RETENTION_SECONDS = 2 * 86400
+
+# How many recent hunts keep their raw job lists for paging / lazy body fetches
+MAX_STORED_HUNTS = 200
+
+# Delta hunts: latest analysis per (role, location, filters, resume)
+MAX_HUNT_SNAPSHOTS = 500
+MAX_SNAPSHOT_STALE_URLS = 300  # Newest stale rejections remembered per snapshot
+
+# Local job corpus: jobs kept (least recently scouted are pruned first)
+MAX_CORPUS_JOBS = int(os.environ.get("MAX_CORPUS_JOBS", "20000"))
+
+# Set by init_db — False if this SQLite build has no FTS5 (corpus search returns nothing)
+_fts_available = True
+
+# Admission slots: a running hunt longer than this (max deadline + slack) is assumed
+# lost with its worker; a queued one that stops polling is dropped much sooner
+RUNNING_SLOT_TTL_SECONDS = 180
+QUEUED_SLOT_TTL_SECONDS = 10
 
 
 def init_db():
-    """Create the seen_jobs table if it doesn't exist."""
+    """Create all memory tables (seen jobs, domain health, Groq usage, hunts, corpus, admission) if missing."""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     cursor.execute('''
@@ -25,13 +62,141 @@ def init_db():
             location_query TEXT
         )
     ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS domain_health (
+            host TEXT PRIMARY KEY,
+            state TEXT,
+            failures INTEGER,
+            opened_at REAL,
+            probe_started_at REAL,
+            last_failure_at REAL,
+            last_success_at REAL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS groq_usage (
+            ts REAL,
+            tokens INTEGER,
+            key_name TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS groq_quota (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            observed_at REAL,
+            token_limit INTEGER,
+            tokens_used INTEGER,
+            retry_at REAL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS hunt_results (
+            hunt_id TEXT PRIMARY KEY,
+            created_at TEXT,
+            jobs_json TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS job_corpus (
+            id INTEGER PRIMARY KEY,
+            url TEXT UNIQUE,
+            title TEXT,
+            body TEXT,
+            full_content TEXT,
+            content_source TEXT,
+            posted_at TEXT,
+            first_seen REAL,
+            last_seen REAL
+        )
+    ''')
+    # Every (role, location) search that scouted a corpus job — a job can match many
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS job_corpus_sightings (
+            url TEXT,
+            job_title_query TEXT,
+            location_query TEXT,
+            last_seen REAL,
+            PRIMARY KEY (url, job_title_query, location_query)
+        )
+    ''')
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_corpus_sightings_location ON job_corpus_sightings (location_query)'
+    )
+    _init_corpus_fts(cursor)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS hunt_slots (
+            slot_id TEXT PRIMARY KEY,
+            client_id TEXT,
+            state TEXT,
+            weight INTEGER,
+            queued_at REAL,
+            heartbeat_at REAL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS hunt_snapshots (
+            hunt_key TEXT PRIMARY KEY,
+            hunt_id TEXT,
+            updated_at TEXT,
+            analyzed_at TEXT,
+            analysis TEXT,
+            stale_urls_json TEXT
+        )
+    ''')
     conn.commit()
     conn.close()
 
 
+def _init_corpus_fts(cursor):
+    """FTS5 index over the corpus, kept in sync by triggers (external-content table)."""
+    global _fts_available
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS job_corpus_fts USING fts5(
+                title, body, full_content,
+                content='job_corpus', content_rowid='id', tokenize='porter unicode61'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        _fts_available = False
+        print(f"⚠️ SQLite FTS5 unavailable, corpus search disabled: {e}")
+        return
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS job_corpus_ai AFTER INSERT ON job_corpus BEGIN
+            INSERT INTO job_corpus_fts (rowid, title, body, full_content)
+            VALUES (new.id, new.title, new.body, new.full_content);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS job_corpus_ad AFTER DELETE ON job_corpus BEGIN
+            INSERT INTO job_corpus_fts (job_corpus_fts, rowid, title, body, full_content)
+            VALUES ('delete', old.id, old.title, old.body, old.full_content);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS job_corpus_au AFTER UPDATE ON job_corpus BEGIN
+            INSERT INTO job_corpus_fts (job_corpus_fts, rowid, title, body, full_content)
+            VALUES ('delete', old.id, old.title, old.body, old.full_content);
+            INSERT INTO job_corpus_fts (rowid, title, body, full_content)
+            VALUES (new.id, new.title, new.body, new.full_content);
+        END
+    ''')
+
+
+def _connect():
+    """Open a connection, creating the tables the first time any query runs."""
+    global _db_ready
+    if not _db_ready:
+        with _db_lock:
+            if not _db_ready:
+                init_db()
+                _db_ready = True
+    return sqlite3.connect(DB_PATH)
+
+
 def is_job_seen(url):
     """Check if a job URL has been seen before."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
     cursor.execute('SELECT 1 FROM seen_jobs WHERE url = ?', (url,))
     result = cursor.fetchone()
@@ -45,7 +210,7 @@ def filter_new_jobs(jobs):
     - new_jobs: jobs not seen before (with is_new=True flag added)
     - seen_jobs: jobs already in the database (with is_new=False flag added)
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
     
     new_jobs = []
@@ -66,7 +231,7 @@ def filter_new_jobs(jobs):
 
 def mark_jobs_seen(jobs, job_title_query="", location_query=""):
     """Store job URLs in the database so we don't show them again."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
     now = datetime.now().isoformat()
     
@@ -83,9 +248,441 @@ def mark_jobs_seen(jobs, job_title_query="", location_query=""):
     conn.close()
 
 
+# ==========================================
+# DEEP-READ CIRCUIT BREAKER (per host)
+# ==========================================
+# closed    → deep reads allowed
+# open      → skipped (snippet fallback) until BREAKER_COOLDOWN_SECONDS pass
+# half_open → one worker probes the host; success closes, failure re-opens
+
+def allow_deep_read(host):
+    """Should we spend a Jina call on this host right now?"""
+    now = time.time()
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute('SELECT state, opened_at, probe_started_at FROM domain_health WHERE host = ?', (host,))
+    row = cursor.fetchone()
+    if row is None or row[0] == 'closed':
+        conn.close()
+        return True
+
+    state, opened_at, probe_started_at = row
+    allowed = False
+    if state == 'open' and now - opened_at >= BREAKER_COOLDOWN_SECONDS:
+        # Cool-down over — exactly one caller wins the half-open probe
+        cursor.execute(
+            "UPDATE domain_health SET state = 'half_open', probe_started_at = ? WHERE host = ? AND state = 'open'",
+            (now, host)
+        )
+        allowed = cursor.rowcount == 1
+    elif state == 'half_open' and now - (probe_started_at or 0) >= BREAKER_PROBE_TIMEOUT_SECONDS:
+        # Previous probe never reported back — take it over
+        cursor.execute(
+            "UPDATE domain_health SET probe_started_at = ? WHERE host = ? AND state = 'half_open' AND probe_started_at IS ?",
+            (now, host, probe_started_at)
+        )
+        allowed = cursor.rowcount == 1
+    conn.commit()
+    conn.close()
+    return allowed
+
+
+def record_deep_read_result(host, success):
+    """Feed one deep-read outcome into the host's breaker."""
+    now = time.time()
+    conn = _connect()
+    cursor = conn.cursor()
+    if success:
+        cursor.execute(
+            "INSERT INTO domain_health (host, state, failures, last_success_at) VALUES (?, 'closed', 0, ?) "
+            "ON CONFLICT(host) DO UPDATE SET state = 'closed', failures = 0, opened_at = NULL, "
+            "probe_started_at = NULL, last_success_at = excluded.last_success_at",
+            (host, now)
+        )
+    else:
+        # A failed half-open probe re-opens immediately; otherwise open at the threshold
+        cursor.execute(
+            "INSERT INTO domain_health (host, state, failures, last_failure_at) VALUES (?, 'closed', 1, ?) "
+            "ON CONFLICT(host) DO UPDATE SET failures = failures + 1, last_failure_at = excluded.last_failure_at",
+            (host, now)
+        )
+        cursor.execute(
+            "UPDATE domain_health SET state = 'open', opened_at = ?, probe_started_at = NULL "
+            "WHERE host = ? AND (state = 'half_open' OR (state = 'closed' AND failures >= ?))",
+            (now, host, BREAKER_FAILURE_THRESHOLD)
+        )
+    conn.commit()
+    conn.close()
+
+
+def get_domain_health():
+    """All tracked hosts with breaker state, for the inspection endpoint."""
+    now = time.time()
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        'SELECT host, state, failures, opened_at, last_failure_at, last_success_at '
+        'FROM domain_health ORDER BY failures DESC, host'
+    )
+    rows = cursor.fetchall()
+    conn.close()
+
+    def iso(ts):
+        return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+    return [{
+        "host": host,
+        "state": state,
+        "failures": failures,
+        "cooldown_remaining_seconds": (
+            max(0, round(BREAKER_COOLDOWN_SECONDS - (now - opened_at))) if state == 'open' and opened_at else 0
+        ),
+        "last_failure_at": iso(last_failure_at),
+        "last_success_at": iso(last_success_at),
+    } for host, state, failures, opened_at, last_failure_at, last_success_at in rows]
+
+
+# ==========================================
+# GROQ TOKEN USAGE (shared by all workers and keys — the quota is per organization)
+# ==========================================
+def record_groq_usage(tokens, key_name=""):
+    """Log the tokens one Groq call consumed."""
+    now = time.time()
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute('INSERT INTO groq_usage (ts, tokens, key_name) VALUES (?, ?, ?)', (now, tokens, key_name))
+    cursor.execute('DELETE FROM groq_usage WHERE ts < ?', (now - GROQ_USAGE_RETENTION_SECONDS,))
+    conn.commit()
+    conn.close()
+
+
+def get_groq_usage_since(since_ts):
+    """Total tokens logged since a unix timestamp."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute('SELECT COALESCE(SUM(tokens), 0) FROM groq_usage WHERE ts >= ?', (since_ts,))
+    total = cursor.fetchone()[0]
+    conn.close()
+    return total
+
+
+def save_groq_quota_snapshot(token_limit, tokens_used, retry_at):
+    """Remember what Groq itself reported in its last rate-limit error."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        'INSERT OR REPLACE INTO groq_quota (id, observed_at, token_limit, tokens_used, retry_at) VALUES (1, ?, ?, ?, ?)',
+        (time.time(), token_limit, tokens_used, retry_at)
+    )
+    conn.commit()
+    conn.close()
+
+
+def get_groq_quota_snapshot():
+    """Last rate-limit snapshot as a dict, or None."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute('SELECT observed_at, token_limit, tokens_used, retry_at FROM groq_quota WHERE id = 1')
+    row = cursor.fetchone()
+    conn.close()
+    if not row:
+        return None
+    return {"observed_at": row[0], "token_limit": row[1], "tokens_used": row[2], "retry_at": row[3]}
+
+
+def save_hunt_jobs(hunt_id, jobs):
+    """Store a hunt's raw job list so clients can page through it (and fetch bodies) later."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        'INSERT OR REPLACE INTO hunt_results (hunt_id, created_at, jobs_json) VALUES (?, ?, ?)',
+        (hunt_id, datetime.now().isoformat(), json.dumps(jobs))
+    )
+    # Keep only the most recent hunts
+    cursor.execute(
+        'DELETE FROM hunt_results WHERE hunt_id NOT IN '
+        '(SELECT hunt_id FROM hunt_results ORDER BY created_at DESC LIMIT ?)',
+        (MAX_STORED_HUNTS,)
+    )
+    conn.commit()
+    conn.close()
+
+
+def get_hunt_jobs(hunt_id):
+    """Return the stored job list for a hunt, or None if it's unknown/expired."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute('SELECT jobs_json FROM hunt_results WHERE hunt_id = ?', (hunt_id,))
+    row = cursor.fetchone()
+    conn.close()
+    return json.loads(row[0]) if row else None
+
+
+def save_hunt_snapshot(hunt_key, hunt_id, analysis, updated_at, analyzed_at, stale_urls=()):
+    """
+    Remember the latest analysis for a hunt key (jobs live in hunt_results under hunt_id).
+    analyzed_at is when the full (non-delta) analysis it was merged onto was made;
+    stale_urls are jobs this hunt already rejected as stale (not re-read on delta runs).
+    """
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        'INSERT OR REPLACE INTO hunt_snapshots (hunt_key, hunt_id, updated_at, analyzed_at, analysis, stale_urls_json) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        (hunt_key, hunt_id, updated_at, analyzed_at, analysis, json.dumps(list(stale_urls)[-MAX_SNAPSHOT_STALE_URLS:]))
+    )
+    cursor.execute(
+        'DELETE FROM hunt_snapshots WHERE hunt_key NOT IN '
+        '(SELECT hunt_key FROM hunt_snapshots ORDER BY updated_at DESC LIMIT ?)',
+        (MAX_HUNT_SNAPSHOTS,)
+    )
+    conn.commit()
+    conn.close()
+
+
+def get_hunt_snapshot(hunt_key):
+    """Latest snapshot with its job list, or None if unknown or its jobs have expired."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        'SELECT s.hunt_id, s.updated_at, s.analyzed_at, s.analysis, s.stale_urls_json, r.jobs_json FROM hunt_snapshots s '
+        'JOIN hunt_results r ON r.hunt_id = s.hunt_id WHERE s.hunt_key = ?',
+        (hunt_key,)
+    )
+    row = cursor.fetchone()
+    conn.close()
+    if not row:
+        return None
+    return {
+        "hunt_id": row[0], "updated_at": row[1], "analyzed_at": row[2], "analysis": row[3],
+        "stale_urls": json.loads(row[4] or "[]"), "jobs": json.loads(row[5]),
+    }
+
+
+# ==========================================
+# ADMISSION SLOTS (concurrency limits shared by all workers)
+# ==========================================
+def claim_hunt_slot(slot_id, client_id, max_running, max_per_client, max_queued, weight=1):
+    """
+    One atomic admission step. `weight` is how many of the max_running slots
+    this hunt occupies (a batch holds one per combo). Returns:
+    - "running"      → the hunt may start (slot held until release_hunt_slot)
+    - "queued"       → waiting in FIFO order; call again to poll (keeps the place alive)
+    - "client_limit" → this client already has max_per_client hunts running/queued
+    - "queue_full"   → max_queued hunts are already waiting
+    """
+    now = time.time()
+    conn = _connect()
+    conn.isolation_level = None
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        cursor.execute(
+            "DELETE FROM hunt_slots WHERE (state = 'running' AND heartbeat_at < ?) "
+            "OR (state = 'queued' AND heartbeat_at < ?)",
+            (now - RUNNING_SLOT_TTL_SECONDS, now - QUEUED_SLOT_TTL_SECONDS)
+        )
+        cursor.execute("SELECT COALESCE(SUM(weight), 0) FROM hunt_slots WHERE state = 'running'")
+        running = cursor.fetchone()[0]
+        cursor.execute('SELECT queued_at FROM hunt_slots WHERE slot_id = ?', (slot_id,))
+        row = cursor.fetchone()
+
+        if row is None:
+            cursor.execute(
+                "SELECT SUM(client_id = ?), SUM(state = 'queued') FROM hunt_slots", (client_id,)
+            )
+            client_slots, queued = (n or 0 for n in cursor.fetchone())
+            if client_slots >= max_per_client:
+                status = "client_limit"
+            elif running + weight <= max_running and queued == 0:
+                status = "running"
+            elif queued >= max_queued:
+                status = "queue_full"
+            else:
+                status = "queued"
+            if status in ("running", "queued"):
+                cursor.execute(
+                    'INSERT INTO hunt_slots (slot_id, client_id, state, weight, queued_at, heartbeat_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (slot_id, client_id, status, weight, now, now)
+                )
+        else:
+            # Still queued: move up once enough slots are free for everyone ahead of us
+            cursor.execute(
+                "SELECT COALESCE(SUM(weight), 0) FROM hunt_slots WHERE state = 'queued' AND queued_at < ?", (row[0],)
+            )
+            ahead = cursor.fetchone()[0]
+            status = "running" if running + ahead + weight <= max_running else "queued"
+            cursor.execute(
+                'UPDATE hunt_slots SET state = ?, heartbeat_at = ? WHERE slot_id = ?',
+                (status, now, slot_id)
+            )
+        cursor.execute('COMMIT')
+    except Exception:
+        cursor.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    return status
+
+
+def release_hunt_slot(slot_id):
+    """Free a running or queued slot."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM hunt_slots WHERE slot_id = ?', (slot_id,))
+    conn.commit()
+    conn.close()
+
+
+# ==========================================
+# LOCAL JOB CORPUS (FTS5)
+# ==========================================
+def _normalize_text(text):
+    """Collapse whitespace so the index and prompts don't carry page layout."""
+    return " ".join((text or "").split())
+
+
+def save_jobs_to_corpus(jobs, job_title_query="", location_query=""):
+    """
+    Upsert scouted jobs into the corpus and record this (role, location) sighting
+    next to any earlier ones. Page content is only stored when it came from a
+    real page read (content_source set); a later snippet-only sighting never
+    overwrites it.
+    """
+    now = time.time()
+    rows = []
+    for job in jobs:
+        source = job.get('content_source')
+        rows.append((
+            job['href'],
+            _normalize_text(job.get('title')),
+            _normalize_text(job.get('body')),
+            job.get('full_content', '') if source else '',
+            source,
+            job.get('posted_at'),
+            now,
+            now,
+        ))
+    if not rows:
+        return
+    location_key = location_query.strip().lower()
+
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.executemany(
+        'INSERT INTO job_corpus (url, title, body, full_content, content_source, posted_at, '
+        'first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+        'ON CONFLICT(url) DO UPDATE SET title = excluded.title, body = excluded.body, '
+        'full_content = CASE WHEN excluded.content_source IS NOT NULL THEN excluded.full_content ELSE full_content END, '
+        'content_source = COALESCE(excluded.content_source, content_source), '
+        'posted_at = COALESCE(excluded.posted_at, posted_at), '
+        'last_seen = excluded.last_seen',
+        rows
+    )
+    cursor.executemany(
+        'INSERT INTO job_corpus_sightings (url, job_title_query, location_query, last_seen) VALUES (?, ?, ?, ?) '
+        'ON CONFLICT(url, job_title_query, location_query) DO UPDATE SET last_seen = excluded.last_seen',
+        [(row[0], job_title_query, location_key, now) for row in rows]
+    )
+    cursor.execute(
+        'DELETE FROM job_corpus WHERE last_seen < '
+        '(SELECT last_seen FROM job_corpus ORDER BY last_seen DESC LIMIT 1 OFFSET ?)',
+        (MAX_CORPUS_JOBS - 1,)
+    )
+    if cursor.rowcount:
+        cursor.execute('DELETE FROM job_corpus_sightings WHERE url NOT IN (SELECT url FROM job_corpus)')
+    conn.commit()
+    conn.close()
+
+
+def update_corpus_reads(jobs):
+    """
+    Store new page reads / parsed dates for corpus matches merged into a hunt.
+    Unlike save_jobs_to_corpus this doesn't count as a sighting: last_seen and
+    the sightings stay put, so an undated job the scouts stopped returning
+    still ages out of search_corpus.
+    """
+    rows = [
+        (job.get('full_content', '') if job.get('content_source') else None,
+         job.get('content_source'), job.get('posted_at'), job['href'])
+        for job in jobs
+        if job.get('content_source') or job.get('posted_at')
+    ]
+    if not rows:
+        return
+
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.executemany(
+        'UPDATE job_corpus SET full_content = COALESCE(?, full_content), '
+        'content_source = COALESCE(?, content_source), posted_at = COALESCE(?, posted_at) '
+        'WHERE url = ?',
+        rows
+    )
+    conn.commit()
+    conn.close()
+
+
+def _corpus_row_to_job(row):
+    url, title, body, full_content, source, posted_at = row
+    job = {"title": title, "href": url, "body": body, "posted_at": posted_at}
+    if source and full_content:
+        job['full_content'] = full_content
+        job['content_source'] = source
+    return job
+
+
+def search_corpus(keywords, location, since_iso, limit=10):
+    """
+    Corpus jobs matching every keyword (porter-stemmed FTS5), scouted for this
+    location by any earlier hunt or mentioning it, posted (or, if undated, last scouted) after since_iso.
+    Best matches first (bm25, title weighted highest).
+    """
+    words = [w for keyword in keywords for w in re.findall(r'\w+', keyword.lower())]
+    if not words or not _fts_available:
+        return []
+    query = " ".join(f'"{w}"' for w in words)
+    since_ts = datetime.fromisoformat(since_iso).timestamp()
+
+    conn = _connect()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            'SELECT c.url, c.title, c.body, c.full_content, c.content_source, c.posted_at '
+            'FROM job_corpus_fts f JOIN job_corpus c ON c.id = f.rowid '
+            'WHERE job_corpus_fts MATCH ? '
+            'AND (c.url IN (SELECT url FROM job_corpus_sightings WHERE location_query = ?) '
+            'OR instr(lower(c.body || \' \' || c.full_content), lower(?)) > 0) '
+            'AND (c.posted_at >= ? OR (c.posted_at IS NULL AND c.last_seen >= ?)) '
+            'ORDER BY bm25(job_corpus_fts, 10.0, 1.0, 2.0) LIMIT ?',
+            (query, location.strip().lower(), location, since_iso, since_ts, limit)
+        )
+        rows = cursor.fetchall()
+    except sqlite3.OperationalError as e:
+        print(f"⚠️ Corpus search failed: {e}")
+        rows = []
+    conn.close()
+    return [_corpus_row_to_job(row) for row in rows]
+
+
+def load_corpus(limit=None):
+    """Every corpus job (most recently scouted first) — for offline benchmarks."""
+    conn = _connect()
+    cursor = conn.cursor()
+    cursor.execute(
+        'SELECT url, title, body, full_content, content_source, posted_at FROM job_corpus '
+        'ORDER BY last_seen DESC LIMIT ?',
+        (-1 if limit is None else limit,)
+    )
+    rows = cursor.fetchall()
+    conn.close()
+    return [_corpus_row_to_job(row) for row in rows]
+
+
 def get_seen_count():
     """Get total number of seen jobs."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
     cursor.execute('SELECT COUNT(*) FROM seen_jobs')
     count = cursor.fetchone()[0]
@@ -94,13 +691,10 @@ def get_seen_count():
 
 
 def clear_memory():
-    """Reset the memory — clear all seen jobs."""
-    conn = sqlite3.connect(DB_PATH)
+    """Reset the memory — clear all seen jobs (and the delta snapshots built on them)."""
+    conn = _connect()
     cursor = conn.cursor()
     cursor.execute('DELETE FROM seen_jobs')
+    cursor.execute('DELETE FROM hunt_snapshots')
     conn.commit()
     conn.close()
-
-
-# Initialize the database on import
-init_db()
@@ -0,0 +1,202 @@
+"""
+Request Profiler — On-Demand Flame Profiles for Slow Hunts
+
+Opt-in, stdlib-only sampling profiler for a single request:
+- Enabled with PROFILING_ENABLED=1, then triggered per request by the
+  `X-Profile: 1` header or for a random PROFILE_SAMPLE_RATE share of hunts
+- Samples every thread the request uses (scout / deep-read pools included)
+  every few ms, so wall time spent WAITING shows up, not just CPU
+- Each sample is attributed to tavily / jina / groq / sqlite / python by
+  the frames on its stack
+- Saved as collapsed stacks (`.folded`, for flamegraph.pl / speedscope)
+  plus a JSON summary, keeping the newest PROFILE_MAX_FILES
+
+Limits: one profile at a time per worker, at most one every
+PROFILE_MIN_INTERVAL_SECONDS, and never longer than PROFILE_MAX_SECONDS.
+With gthread workers, another request that starts on a fresh thread during
+a profile may be sampled too (its stacks are labelled by thread name).
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "0") == "1"
+
+# Share of /api/hunt* requests profiled without the header (0 = header only)
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+
+PROFILE_DIR = os.environ.get("PROFILE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles')
+PROFILE_MAX_FILES = int(os.environ.get("PROFILE_MAX_FILES", "50"))
+PROFILE_MIN_INTERVAL_SECONDS = float(os.environ.get("PROFILE_MIN_INTERVAL_SECONDS", "30"))
+PROFILE_INTERVAL_SECONDS = 0.005  # 5ms between samples
+PROFILE_MAX_SECONDS = 120  # Sampler stops by itself after this
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# Stack attribution: first match walking from the innermost frame outwards
+WAIT_CATEGORIES = [
+    ("sqlite", lambda filename, name: filename.endswith("job_memory.py")),
+    ("jina", lambda filename, name: name == "fetch_full_job_content"),
+    ("tavily", lambda filename, name: f"{os.sep}tavily{os.sep}" in filename),
+    ("groq", lambda filename, name: f"{os.sep}groq{os.sep}" in filename or name == "execute_analysis"),
+]
+
+_profile_lock = threading.Lock()
+_last_profile_started = 0.0
+
+
+def should_profile(headers, path):
+    """Header opt-in, or random sampling of hunts — both only when PROFILING_ENABLED."""
+    if not PROFILING_ENABLED:
+        return False
+    if headers.get("X-Profile") == "1":
+        return True
+    return path.startswith("/api/hunt") and random.random() < PROFILE_SAMPLE_RATE
+
+
+def start_profile(label):
+    """
+    Start sampling the calling thread (and threads it spawns).
+    Returns a profile dict, or None if another profile is running or the rate limit applies.
+    """
+    global _last_profile_started
+    now = time.monotonic()
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    if now - _last_profile_started < PROFILE_MIN_INTERVAL_SECONDS:
+        _profile_lock.release()
+        return None
+    _last_profile_started = now
+
+    profile = {
+        "id": uuid.uuid4().hex,
+        "label": label,
+        "started_at": datetime.now().isoformat(),
+        "thread": threading.get_ident(),
+        # Threads alive before the request (other workers' helpers, warm-up) are ignored
+        "baseline_threads": set(sys._current_frames()) - {threading.get_ident()},
+        "stacks": Counter(),
+        "categories": Counter(),
+        "samples": 0,
+        "wall_started": now,
+        "cpu_started": time.process_time(),
+        "stop": threading.Event(),
+    }
+    sampler = threading.Thread(target=_sample_loop, args=(profile,), daemon=True)
+    profile["sampler"] = sampler
+    sampler.start()
+    return profile
+
+
+def _categorize(stack):
+    for code in reversed(stack):
+        for category, matches in WAIT_CATEGORIES:
+            if matches(code.co_filename, code.co_name):
+                return category
+    return "python"
+
+
+def _sample_loop(profile):
+    me = threading.get_ident()
+    deadline = time.monotonic() + PROFILE_MAX_SECONDS
+    names = {}
+    while not profile["stop"].wait(PROFILE_INTERVAL_SECONDS) and time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == me or ident in profile["baseline_threads"]:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            # Idle pool threads have none of our frames on the stack
+            if not any(code.co_filename.startswith(BACKEND_DIR) for code in stack):
+                continue
+            if ident not in names:
+                names[ident] = "request" if ident == profile["thread"] else next(
+                    (t.name for t in threading.enumerate() if t.ident == ident), f"thread-{ident}"
+                )
+            frames = ";".join(f"{os.path.basename(code.co_filename)}:{code.co_name}" for code in stack)
+            profile["stacks"][f"{names[ident]};{frames}"] += 1
+            profile["categories"][_categorize(stack)] += 1
+            profile["samples"] += 1
+
+
+def finish_profile(profile, status_code=None):
+    """Stop sampling, write the profile to PROFILE_DIR and prune old ones. Returns the summary."""
+    try:
+        profile["stop"].set()
+        profile["sampler"].join(timeout=1)
+
+        wall_seconds = time.monotonic() - profile["wall_started"]
+        summary = {
+            "id": profile["id"],
+            "label": profile["label"],
+            "status_code": status_code,
+            "started_at": profile["started_at"],
+            "wall_seconds": round(wall_seconds, 3),
+            "cpu_seconds": round(time.process_time() - profile["cpu_started"], 3),
+            "samples": profile["samples"],
+            "interval_ms": PROFILE_INTERVAL_SECONDS * 1000,
+            # Thread-seconds per category (parallel deep reads can sum past wall time)
+            "breakdown_seconds": {
+                category: round(count * PROFILE_INTERVAL_SECONDS, 3)
+                for category, count in profile["categories"].most_common()
+            },
+        }
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        with open(os.path.join(PROFILE_DIR, f"{profile['id']}.folded"), "w") as f:
+            for stack, count in profile["stacks"].most_common():
+                f.write(f"{stack} {count}\n")
+        with open(os.path.join(PROFILE_DIR, f"{profile['id']}.json"), "w") as f:
+            json.dump(summary, f)
+        _prune_profiles()
+
+        print(f"🔬 Profile {profile['id']} saved: {summary['wall_seconds']}s wall, {summary['breakdown_seconds']}")
+        return summary
+    finally:
+        _profile_lock.release()
+
+
+def _prune_profiles():
+    summaries = sorted(
+        (f for f in os.listdir(PROFILE_DIR) if f.endswith(".json")),
+        key=lambda f: os.path.getmtime(os.path.join(PROFILE_DIR, f)),
+        reverse=True,
+    )
+    for name in summaries[PROFILE_MAX_FILES:]:
+        profile_id = name[:-len(".json")]
+        for ext in (".json", ".folded"):
+            path = os.path.join(PROFILE_DIR, profile_id + ext)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def list_profiles():
+    """Summaries of stored profiles, newest first."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    summaries = []
+    for name in os.listdir(PROFILE_DIR):
+        if name.endswith(".json"):
+            with open(os.path.join(PROFILE_DIR, name)) as f:
+                summaries.append(json.load(f))
+    return sorted(summaries, key=lambda s: s["started_at"], reverse=True)
+
+
+def get_profile_path(profile_id, kind="folded"):
+    """Path of a stored profile file ("folded" or "json"), or None if unknown."""
+    if not PROFILE_ID_PATTERN.match(profile_id) or kind not in ("folded", "json"):
+        return None
+    path = os.path.join(PROFILE_DIR, f"{profile_id}.{kind}")
+    return path if os.path.exists(path) else None
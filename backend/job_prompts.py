@@ -0,0 +1,271 @@
+"""
+Prompt Templates — compiled once, reused for every Groq call
+
+The static scaffolding (persona, date rules, checklist, output format) depends
+only on (time_filter, job_type, has_resume, variant). It's compiled once per
+combination and sent as the SYSTEM message, so every call with the same
+combination shares an identical prefix the provider can cache. Only the
+variable part (today's date, mission, resume, job data) goes in the USER message.
+
+Variants:
+- "full":    the original forensic-recruiter prompt (dedented — no wasted indentation tokens)
+- "compact": same rules and identical output format at a fraction of the tokens
+"""
+
+import datetime
+import os
+import textwrap
+from functools import lru_cache
+
+# Default variant for single hunts; callers may override per call
+PROMPT_VARIANT = os.environ.get("PROMPT_VARIANT", "full")
+PROMPT_VARIANTS = ("full", "compact")
+
+TIME_FILTER_KEYS = ("past_day", "past_week", "past_month")
+
+# Rough token estimate for Llama-family tokenizers on English/markdown
+CHARS_PER_TOKEN = 4
+
+# How much of each job's content / the resume goes into the prompt, per variant
+JOB_CONTENT_CHARS = {"full": 2500, "compact": 1200}
+RESUME_CHARS = {"full": 2000, "compact": 1500}
+
+# --- The Persona ---
+FRESHNESS_PERSONA = {
+    "past_day": "If a job looks older than 24 HOURS, discard it immediately.",
+    "past_week": "If a job looks older than 7 DAYS, discard it immediately.",
+    "past_month": "If a job looks older than 30 DAYS, discard it immediately.",
+}
+
+# Job type filter instruction
+JOB_TYPE_LABELS = {
+    "internship": "ONLY include INTERNSHIP positions. Reject full-time, contract, or senior roles.",
+    "fulltime": "ONLY include FULL-TIME positions. Reject internships, part-time, or contract roles.",
+    "parttime": "ONLY include PART-TIME positions. Reject full-time or internship roles.",
+    "contract": "ONLY include CONTRACT positions. Reject permanent or internship roles.",
+    "freelance": "ONLY include FREELANCE or REMOTE CONTRACT positions.",
+    "any": "Include any job type (internship, full-time, contract, etc.).",
+}
+
+NO_RESULTS_LINE = "❌ No fresh, legitimate job postings found. Try 'Past Month' filter or search directly on LinkedIn/Indeed."
+
+
+def estimate_tokens(text):
+    """Cheap token estimate (no tokenizer dependency)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _output_format(has_resume):
+    """FINAL OUTPUT FORMAT — identical for both variants (the frontend renders it)."""
+    resume_lines = {
+        "fit": "**Fit Score:** [0-100%]\n" if has_resume else "",
+        "matches": "**✅ Matches:** [Skills you have that match]\n" if has_resume else "",
+        "gaps": "**⚠️ Gaps:** [Skills required but missing from resume]\n" if has_resume else "",
+    }
+    return (
+        "### 🏆 TOP JOB MATCH [1]\n"
+        "**Job Title:** [Exact Title]\n"
+        "**Company:** [Company Name]\n"
+        "**Type:** [Internship / Full-Time / Contract / etc.]\n"
+        "**Location:** [Where]\n"
+        "**Freshness:** [e.g. \"Posted today\", \"2 days ago\"]\n"
+        f"{resume_lines['fit']}"
+        "**Why it matches:** [1 sentence]\n"
+        f"{resume_lines['matches']}"
+        f"{resume_lines['gaps']}"
+        "**Direct Link:** [Full URL]\n"
+        "\n"
+        "(Repeat for Top 2-5. Stop early if fewer exist. DO NOT INVENT JOBS.)\n"
+        "\n"
+        "If ZERO real job postings pass your filters, say:\n"
+        f"\"{NO_RESULTS_LINE}\""
+    )
+
+
+def _full_system_prompt(time_filter, job_type, has_resume):
+    job_type_instruction = JOB_TYPE_LABELS.get(job_type, JOB_TYPE_LABELS["any"])
+    persona = FRESHNESS_PERSONA.get(time_filter, FRESHNESS_PERSONA["past_week"])
+
+    prompt = textwrap.dedent(f"""\
+        You are an Elite Technical Recruiter and Forensic Job Analyst.
+        Your standard is perfection. You DO NOT tolerate old, stale, or irrelevant results.
+
+        ⚠️ CRITICAL DATE VALIDATION RULES ⚠️
+        The job listings you receive may contain MISLEADING date information in snippets.
+        You MUST validate dates using the FULL CONTENT field.
+
+        DATE VALIDATION PROTOCOL:
+        1. Check the FULL CONTENT for date indicators: "years ago", "months ago", "weeks ago", "days ago"
+        2. If you see "2 years ago", "6 months ago", "3 weeks ago" in content → REJECT IMMEDIATELY
+        3. If no clear recent date is visible → ASSUME IT'S OLD and REJECT
+        4. ONLY accept jobs that explicitly show: "today", "yesterday", "1 day ago", "2 days ago" for past_day filter
+        5. For past_week: ONLY accept "today", "yesterday", "X days ago" where X ≤ 7
+        6. If a job page shows date indicators like "2yr", "6yr", "months" → IMMEDIATE REJECTION
+
+        Your Prime Directives:
+        1. FILTER RUTHLESSLY: {persona}
+        2. DATE VALIDATION: Check FULL CONTENT for actual dates. Snippets LIE. Trust only full page content.
+        3. JOB TYPE FILTER: {job_type_instruction}
+        4. DETECT SEO SPAM: Articles, LinkedIn profiles (not job posts), forums, tutorials — BURN THEM.
+        5. PRIORITIZE "NEW" JOBS: Jobs marked "NEW ✨" should rank higher.
+        6. CHECK FOR "CLOSED": If content says "closed", "expired", "position filled" — REJECT.
+        7. NO DATE VISIBLE = OLD JOB: If you can't clearly see a recent date, REJECT IT.
+        8. NEVER INVENT: If fewer than 3 good jobs exist, stop early. Do NOT hallucinate.
+
+        ⚠️ CRITICAL: Deep-read jobs carry the key sections of the FULL PAGE in CONTENT
+        (TITLE / POSTED / JOB TYPE / STATUS / REQUIREMENTS / SUMMARY).
+        The snippet may say "Posted today" but the POSTED and STATUS lines show the REAL state.
+        You MUST read the FULL CONTENT carefully for date indicators.
+
+        --------------------------------------------------
+        YOUR ANALYSIS PROCESS (Mental Scratchpad):
+        For EACH job match:
+        0. FIRST: Scan the CONTENT for date indicators ("years ago", "yr", "months ago", etc.)
+        1. Does CONTENT show "years ago", "yr", "6 months ago", "2 weeks ago"? → REJECT IMMEDIATELY.
+        2. Does the content say "closed", "expired", "filled"? → REJECT.
+        3. Is the title a person's name/profile (not a job)? → REJECT.
+        4. Is the URL a blog, tutorial, or forum? → REJECT.
+        5. Is it from a job board or company careers page? → Check date anyway.
+        6. Does it mention tech stacks, "hiring", "apply now", salary? → Good sign, but CHECK DATE FIRST.
+        7. Does the job type match "{job_type}"? → If not, REJECT.
+        8. Can you see a clear, recent date matching {time_filter}? → If NO, REJECT.
+        --------------------------------------------------
+        """)
+
+    if has_resume:
+        prompt += textwrap.dedent("""
+            ADDITIONAL TASK — RESUME MATCHING:
+            For each job, compare the requirements against the CANDIDATE RESUME and provide:
+            - **Fit Score (0-100%)**: How well the candidate matches
+            - **✅ Matches**: Skills/experience the candidate HAS that the job requires
+            - **⚠️ Gaps**: Skills the job requires but the candidate LACKS
+            """)
+
+    return prompt + "\nFINAL OUTPUT FORMAT:\n\n" + _output_format(has_resume)
+
+
+def _compact_system_prompt(time_filter, job_type, has_resume):
+    job_type_instruction = JOB_TYPE_LABELS.get(job_type, JOB_TYPE_LABELS["any"])
+    persona = FRESHNESS_PERSONA.get(time_filter, FRESHNESS_PERSONA["past_week"])
+
+    prompt = textwrap.dedent(f"""\
+        You are a strict job-posting analyst. Never invent jobs.
+        Freshness ({time_filter}): {persona} No clear recent date = old.
+        Job type: {job_type_instruction}
+        Trust POSTED / STATUS / parsed date over snippet claims.
+        REJECT: too old or undated; closed/expired/filled/no longer accepting; not a job posting
+        (profile, article, forum, tutorial, search page); wrong job type.
+        Rank NEW ✨ jobs higher. Return the top 5 at most; stop early if fewer qualify.
+        """)
+    if has_resume:
+        prompt += "Compare each job with the CANDIDATE RESUME: Fit Score 0-100%, Matches, Gaps.\n"
+
+    return prompt + "\nOutput format:\n\n" + _output_format(has_resume)
+
+
+@lru_cache(maxsize=None)
+def get_system_prompt(time_filter, job_type, has_resume, variant=PROMPT_VARIANT):
+    """Compiled static prefix for one (time_filter, job_type, has_resume, variant) combination."""
+    if variant == "compact":
+        return _compact_system_prompt(time_filter, job_type, has_resume)
+    return _full_system_prompt(time_filter, job_type, has_resume)
+
+
+def build_job_text(job_list, variant=PROMPT_VARIANT):
+    """--- Evidence --- one block per job."""
+    limit = JOB_CONTENT_CHARS.get(variant, JOB_CONTENT_CHARS["full"])
+    blocks = []
+    for i, job in enumerate(job_list):
+        full_content = job.get('full_content', job.get('body', ''))[:limit]
+        posted = job.get('posted_at') or "not found"
+        if variant == "compact":
+            new = "NEW ✨" if job.get('is_new', True) else "seen"
+            blocks.append(f"#{i+1} {new} | {job['title']} | {job['href']} | parsed date: {posted}\n{full_content}")
+        else:
+            blocks.append(
+                f"[JOB MATCH #{i+1}]\n"
+                f"- URL: {job['href']}\n"
+                f"- TITLE: {job['title']}\n"
+                f"- CONTENT: {full_content}\n"
+                f"- PARSED POST DATE: {posted}\n"
+                f"- NEW: {'YES ✨' if job.get('is_new', True) else 'PREVIOUSLY SEEN'}"
+            )
+    return "\n\n".join(blocks)
+
+
+def _resume_block(resume_text, variant):
+    if not (resume_text and resume_text.strip()):
+        return ""
+    return f"📋 CANDIDATE RESUME:\n{resume_text[:RESUME_CHARS.get(variant, RESUME_CHARS['full'])]}\n\n"
+
+
+def _mission_header(time_filter, job_type):
+    # Job type display
+    type_display = f" ({job_type.upper()})" if job_type != "any" else ""
+    # LAYER 2: Inject TODAY'S DATE for mathematical validation
+    today_str = datetime.date.today().strftime("%B %d, %Y")  # e.g., "February 11, 2026"
+    return type_display, today_str
+
+
+def build_user_prompt(job_list, job_title, location, time_filter, resume_text, job_type, variant=PROMPT_VARIANT):
+    """--- The Mission --- variable suffix for a single hunt."""
+    type_display, today_str = _mission_header(time_filter, job_type)
+    return (
+        f"🗓️ TODAY'S DATE is: {today_str}\n\n"
+        f"MISSION: Find the top 5 ACTIVE{type_display} job openings for '{job_title}' in '{location}'.\n"
+        f"TIME FILTER: {time_filter}\n\n"
+        f"{_resume_block(resume_text, variant)}"
+        f"Here is the raw data stream from the web:\n\n"
+        f"{build_job_text(job_list, variant)}"
+    )
+
+
+def build_batch_user_prompt(hunts, job_pool, time_filter, resume_text, job_type, variant=PROMPT_VARIANT):
+    """
+    --- The Batch Mission --- several hunts over ONE shared job pool.
+    Each job appears once even if several hunts found it; hunts reference jobs by #number.
+    """
+    type_display, today_str = _mission_header(time_filter, job_type)
+    pool_index = {job['href']: i + 1 for i, job in enumerate(job_pool)}
+
+    hunt_lines = ""
+    for k, hunt in enumerate(hunts, start=1):
+        candidates = ", ".join(f"#{pool_index[job['href']]}" for job in hunt['jobs'])
+        hunt_lines += f"- HUNT [{k}]: '{hunt['job_title']}' in '{hunt['location']}' — candidates: {candidates}\n"
+
+    return (
+        f"🗓️ TODAY'S DATE is: {today_str}\n\n"
+        f"MISSION: You are running {len(hunts)} job hunts at once over ONE shared pool of jobs.\n"
+        f"For EACH hunt, find the top 5 ACTIVE{type_display} job openings among THAT hunt's candidates only.\n"
+        f"TIME FILTER: {time_filter}\n\n"
+        f"HUNTS:\n{hunt_lines}\n"
+        f"Write one section per hunt, in order. Start each section with this exact line:\n"
+        f"===== HUNT [k] =====\n"
+        f"(k = hunt number), then that hunt's report in the output format.\n\n"
+        f"{_resume_block(resume_text, variant)}"
+        f"Here is the shared raw data stream from the web:\n\n"
+        f"{build_job_text(job_pool, variant)}"
+    )
+
+
+def report_prompt_token_counts():
+    """
+    Compile every template and print its estimated token cost. Called at startup
+    so prompt growth is visible in the logs.
+    """
+    print(f"🧮 Prompt templates (estimated tokens, ~{CHARS_PER_TOKEN} chars/token):")
+    counts = {}
+    for variant in PROMPT_VARIANTS:
+        sizes = [
+            estimate_tokens(get_system_prompt(time_filter, job_type, has_resume, variant))
+            for time_filter in TIME_FILTER_KEYS
+            for job_type in JOB_TYPE_LABELS
+            for has_resume in (False, True)
+        ]
+        counts[variant] = sizes
+        print(f"   {variant:<8} {len(sizes)} templates, {min(sizes)}-{max(sizes)} tokens of static prefix")
+
+    full_avg = sum(counts["full"]) / len(counts["full"])
+    compact_avg = sum(counts["compact"]) / len(counts["compact"])
+    print(f"   compact is {compact_avg / full_avg:.0%} of full (default variant: {PROMPT_VARIANT})")
+    return counts
@@ -0,0 +1,237 @@
+"""
+Local Ranker — Zero-LLM Fallback Report
+
+When Groq can't be used (daily token quota gone, all keys failing, or the hunt
+deadline already spent), this builds the same markdown report the model would,
+in milliseconds, from signals we already have:
+- Existing stale / search-page pre-filters + closed-status lines from deep read
+- Local posting dates (job_dates)
+- Keyword relevance against job_title / job_type
+- Skill overlap with the resume for Fit Score, Matches and Gaps
+"""
+
+import re
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from job_dates import extract_posted_at, TIME_FILTER_DAYS
+from job_engine import is_likely_stale, is_search_page, CLOSED_STATUS_PATTERN
+from job_prompts import NO_RESULTS_LINE
+
+MAX_RESULTS = 5
+
+# Score weights (sum to 1.0)
+RELEVANCE_WEIGHT = 0.5
+FRESHNESS_WEIGHT = 0.3
+FIT_WEIGHT = 0.1
+NEW_WEIGHT = 0.1
+
+# Undated jobs get this freshness score (the model would usually reject them)
+UNDATED_FRESHNESS = 0.2
+
+WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = {
+    "a", "an", "and", "the", "of", "in", "for", "to", "at", "with", "on", "or",
+    "jr", "sr", "junior", "senior", "intern", "developer", "engineer", "remote",
+}
+
+# Job type → phrases that confirm it
+JOB_TYPE_PHRASES = {
+    "internship": ("internship", "intern ", "trainee"),
+    "fulltime": ("full-time", "full time", "permanent"),
+    "parttime": ("part-time", "part time"),
+    "contract": ("contract", "contractor", "temporary", "freelance"),
+    "freelance": ("freelance", "contract", "remote contract"),
+}
+
+JOB_TYPE_DISPLAY = {
+    "internship": "Internship",
+    "fulltime": "Full-Time",
+    "parttime": "Part-Time",
+    "contract": "Contract",
+    "freelance": "Freelance",
+}
+
+# Skills vocabulary for resume matching (lowercase, as they appear in text)
+SKILL_KEYWORDS = {
+    "python", "java", "javascript", "typescript", "go", "golang", "rust", "c++", "c#", "kotlin", "swift",
+    "php", "ruby", "scala", "r", "sql", "nosql", "html", "css", "bash",
+    "react", "angular", "vue", "next.js", "node.js", "express", "django", "flask", "fastapi", "spring",
+    "flutter", "react native", "android", "ios", "graphql", "rest",
+    "aws", "gcp", "azure", "docker", "kubernetes", "terraform", "ansible", "jenkins", "ci/cd", "linux", "git",
+    "postgresql", "mysql", "mongodb", "redis", "kafka", "spark", "hadoop", "airflow", "snowflake", "etl",
+    "tableau", "power bi", "excel",
+    "machine learning", "deep learning", "nlp", "computer vision", "pytorch", "tensorflow", "scikit-learn",
+    "pandas", "numpy", "llm", "mlops", "statistics",
+    "blockchain", "solidity", "security", "figma", "agile", "scrum", "jira",
+}
+# Multi-word / punctuated skills need substring matching; single words use the token set
+PHRASE_SKILLS = {s for s in SKILL_KEYWORDS if not re.fullmatch(r"[a-z0-9]+", s)}
+WORD_SKILLS = SKILL_KEYWORDS - PHRASE_SKILLS
+
+
+def _tokens(text):
+    return set(WORD_PATTERN.findall(text.lower()))
+
+
+def extract_skills(text):
+    """Skills from SKILL_KEYWORDS mentioned in `text`."""
+    lowered = text.lower()
+    found = WORD_SKILLS & _tokens(lowered)
+    found |= {phrase for phrase in PHRASE_SKILLS if phrase in lowered}
+    return found
+
+
+def query_keywords(job_title):
+    """Search keywords that carry meaning ("Senior Python Developer" → {"python"})."""
+    return _tokens(job_title) - STOPWORDS or _tokens(job_title)
+
+
+def keyword_relevance(job_title, title, content):
+    """
+    Share of search keywords in the title (double weight) and content, 0-1.
+    Returns (relevance, query_words, title_hits).
+    """
+    query_words = query_keywords(job_title)
+    title_hits = query_words & _tokens(title)
+    content_hits = query_words & _tokens(content)
+    relevance = (2 * len(title_hits) + len(content_hits)) / (3 * len(query_words)) if query_words else 0.0
+    return relevance, query_words, title_hits
+
+
+def _split_title(title, href):
+    """'Python Developer - Acme | LinkedIn' → ('Python Developer', 'Acme')."""
+    parts = [p.strip() for p in re.split(r"\s+[-|–—]\s+|\s+at\s+", title) if p.strip()]
+    job_title = parts[0] if parts else title
+    company = parts[1] if len(parts) > 1 else urlparse(href).netloc.replace("www.", "")
+    return job_title, company
+
+
+def _detect_job_type(text):
+    lowered = text.lower()
+    for job_type, phrases in JOB_TYPE_PHRASES.items():
+        if any(p in lowered for p in phrases):
+            return job_type
+    return None
+
+
+def _freshness_label(posted_at, now):
+    if posted_at is None:
+        return "Date not found", None
+    age_days = max(0.0, (now - posted_at).total_seconds() / 86400)
+    if age_days < 1:
+        label = "Posted today"
+    elif age_days < 2:
+        label = "1 day ago"
+    else:
+        label = f"{int(age_days)} days ago"
+    return label, age_days
+
+
+def score_job(job, job_title, time_filter, job_type, resume_skills, now):
+    """Score one job 0-1 and collect what the report needs. None if it should be rejected."""
+    content = job.get('full_content') or job.get('body', '')
+    text = f"{job.get('title', '')} {content}"
+
+    # Same pre-filters the scout uses (they substring-match "closed"/"filled", so only on
+    # the snippet); deep-read pages are checked for real closed banners instead
+    if is_search_page(job['href']) or is_likely_stale(job, time_filter):
+        return None
+    if CLOSED_STATUS_PATTERN.search(content):
+        return None
+
+    posted_at = None
+    if job.get('posted_at'):
+        posted_at = datetime.fromisoformat(job['posted_at'])
+    else:
+        posted_at = extract_posted_at(text, now)
+    freshness_label, age_days = _freshness_label(posted_at, now)
+    window_days = TIME_FILTER_DAYS.get(time_filter, 7)
+    if posted_at is not None and age_days > window_days + 0.5:
+        return None
+    freshness = UNDATED_FRESHNESS if posted_at is None else max(0.0, 1 - age_days / (window_days + 1))
+
+    relevance, query_words, title_hits = keyword_relevance(job_title, job.get('title', ''), content)
+
+    detected_type = _detect_job_type(text)
+    if job_type != "any":
+        if detected_type and detected_type != job_type:
+            return None  # Clearly the wrong type
+        if detected_type == job_type:
+            relevance = min(1.0, relevance + 0.2)
+
+    job_skills = extract_skills(text)
+    matches = sorted(job_skills & resume_skills)
+    gaps = sorted(job_skills - resume_skills)
+    fit = len(matches) / len(job_skills) if job_skills else 0.0
+
+    score = (
+        RELEVANCE_WEIGHT * relevance
+        + FRESHNESS_WEIGHT * freshness
+        + (FIT_WEIGHT * fit if resume_skills else 0.0)
+        + (NEW_WEIGHT if job.get('is_new', True) else 0.0)
+    )
+    return {
+        "job": job,
+        "score": score,
+        "freshness": freshness_label,
+        "detected_type": detected_type,
+        "title_hits": sorted(title_hits),
+        "query_words": query_words,
+        "job_skills": sorted(job_skills),
+        "fit": fit,
+        "matches": matches,
+        "gaps": gaps,
+    }
+
+
+def rank_jobs_locally(job_list, job_title, location, time_filter="past_week", resume_text="", job_type="any", reason=""):
+    """
+    Build a ranked markdown report without any LLM call.
+    Same format as the Groq report, prefixed with a short note explaining why.
+    """
+    now = datetime.now(timezone.utc)
+    has_resume = bool(resume_text and resume_text.strip())
+    resume_skills = extract_skills(resume_text) if has_resume else set()
+
+    scored = [s for s in (score_job(job, job_title, time_filter, job_type, resume_skills, now) for job in job_list) if s]
+    scored.sort(key=lambda s: s["score"], reverse=True)
+
+    note = "> ⚡ **Offline ranking** — "
+    note += f"{reason}. " if reason else ""
+    note += "Ranked locally by freshness, keyword relevance and resume overlap; verify dates on the job page."
+
+    if not scored:
+        return f"{note}\n\n{NO_RESULTS_LINE}"
+
+    sections = []
+    for rank, s in enumerate(scored[:MAX_RESULTS], start=1):
+        job = s["job"]
+        title, company = _split_title(job.get('title', ''), job['href'])
+        job_type_label = JOB_TYPE_DISPLAY.get(s["detected_type"] or job_type, "Not stated")
+        if s["title_hits"]:
+            why = f"Title matches {len(s['title_hits'])}/{len(s['query_words'])} search keywords ({', '.join(s['title_hits'])})"
+        else:
+            why = "Mentions your search keywords in the posting"
+        if s["job_skills"]:
+            why += f"; mentions {', '.join(s['job_skills'][:5])}"
+
+        lines = [
+            f"### 🏆 TOP JOB MATCH [{rank}]",
+            f"**Job Title:** {title}",
+            f"**Company:** {company}",
+            f"**Type:** {job_type_label}",
+            f"**Location:** {location}",
+            f"**Freshness:** {s['freshness']}",
+        ]
+        if has_resume:
+            lines.append(f"**Fit Score:** {round(s['fit'] * 100)}%")
+        lines.append(f"**Why it matches:** {why}.")
+        if has_resume:
+            lines.append(f"**✅ Matches:** {', '.join(s['matches']) or 'No listed skills overlap'}")
+            lines.append(f"**⚠️ Gaps:** {', '.join(s['gaps']) or 'None detected'}")
+        lines.append(f"**Direct Link:** {job['href']}")
+        sections.append("\n".join(lines))
+
+    return note + "\n\n" + "\n\n".join(sections)
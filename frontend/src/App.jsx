@@ -40,6 +40,7 @@ function App() {
   const [resumePreview, setResumePreview] = useState('')
   const [memoryCount, setMemoryCount] = useState(0)
   const [showRaw, setShowRaw] = useState(false)
+  const [loadingMoreJobs, setLoadingMoreJobs] = useState(false)
   const fileInputRef = useRef(null)
 
   // API Configuration
@@ -80,6 +81,18 @@ function App() {
     } finally { setLoading(false) }
   }
 
+  // raw_jobs arrives one page at a time — fetch the rest of the hunt's jobs on demand
+  const handleLoadMoreJobs = async () => {
+    if (!results?.hunt_id || !results.has_more) return
+    setLoadingMoreJobs(true)
+    try {
+      const res = await axios.get(`${API_BASE_URL}/api/hunt/${results.hunt_id}/jobs`, { params: { page: results.page + 1, page_size: results.page_size } })
+      setResults(prev => ({ ...prev, raw_jobs: [...prev.raw_jobs, ...res.data.raw_jobs], page: res.data.page, has_more: res.data.has_more }))
+    } catch (err) {
+      console.error('Failed to load more jobs:', err)
+    } finally { setLoadingMoreJobs(false) }
+  }
+
   const handleFileUpload = async (e) => {
     const file = e.target.files[0]
     if (!file) return
@@ -329,6 +342,11 @@ function App() {
                             </a>
                           ))}
                         </div>
+                        {results.has_more && (
+                          <button className="raw-links-more" onClick={handleLoadMoreJobs} disabled={loadingMoreJobs}>
+                            {loadingMoreJobs ? 'Loading…' : `Show more (${results.raw_jobs.length} of ${results.raw_jobs_total})`}
+                          </button>
+                        )}
                       </motion.div>
                     )}
                   </AnimatePresence>
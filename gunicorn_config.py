@@ -1,2 +1,22 @@
+import os
+import sys
+import threading
+
 bind = "0.0.0.0:10000"
 workers = 2
+
+# Threads let excess hunts reach admission control (fast 429/503) instead of
+# waiting in the socket backlog until they time out; see backend/job_admission.py
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+
+def post_worker_init(worker):
+    """Warm heavy imports/clients in the background once the worker is accepting requests."""
+    if os.environ.get("WARM_UP_ON_START", "1") != "1":
+        return
+    # The Flask app is already loaded; find its module however it was imported (app / backend.app)
+    app_module = sys.modules.get(worker.wsgi.import_name)
+    warm_up = getattr(app_module, "warm_up", None)
+    if warm_up:
+        threading.Thread(target=warm_up, daemon=True).start()